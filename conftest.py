@@ -0,0 +1,12 @@
+"""
+Root pytest configuration.
+
+The scripts under test_archive/ are network-dependent (they deploy to a
+live Sapphire endpoint) and import the full web3/sapphire stack at
+collection time, so a bare `pytest` run should not pick them up. Set
+RUN_ARCHIVE_TESTS=1 to opt back in when a configured network and the
+chain dependencies are available.
+"""
+import os
+
+collect_ignore = [] if os.getenv("RUN_ARCHIVE_TESTS") == "1" else ["test_archive"]
@@ -4,16 +4,23 @@ This module provides integration with Oasis Sapphire for confidential computing.
 """
 
 import json
+import base64
+import re
+import hashlib
 import os
 import time
 import logging
 import subprocess
 import asyncio
+import threading
+import concurrent.futures
 from typing import Dict, Any, List, Optional, Callable, Tuple
 
+import aiohttp
 from web3 import AsyncWeb3
 from web3.middleware import SignAndSendRawMiddlewareBuilder
 from eth_account import Account
+from eth_utils import keccak
 from eth_account.signers.local import LocalAccount
 from sapphirepy import sapphire
 
@@ -35,8 +42,97 @@ except ImportError:
     logger.warning("solcx not installed. Contract compilation will not be available.")
     solcx = None
 
+# On-disk solc output cache; repeated compiles of unchanged sources skip
+# solc across processes, not just within one
+_COMPILE_CACHE_DIR = os.path.normpath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", ".cache", "solc"))
+
+# Record of previous deployments keyed by network and code digest, so a
+# persistent devnet can reuse contracts instead of redeploying them
+_DEPLOYMENTS_PATH = os.path.join(os.path.dirname(_COMPILE_CACHE_DIR), "deployments.json")
+
+# Solidity versions already present in the solcx install directory;
+# lets compile_contract skip the per-call install probe.
+if solcx:
+    try:
+        _INSTALLED_SOLC = {str(v) for v in solcx.get_installed_solc_versions()}
+    except Exception:
+        _INSTALLED_SOLC = set()
+else:
+    _INSTALLED_SOLC = set()
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Fast JSON helpers: orjson when available, stdlib fallback otherwise.
+# Both produce/consume bytes-compatible compact JSON.
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# "key: value" lines in oasis CLI output, matched in one pass
+_SHOW_LINE_RE = re.compile(r'^([^:\n]+):\s*(.+)$', re.MULTILINE)
+
+# Targeted extraction patterns for oasis CLI output; re.search scans once
+# without tokenizing the whole blob
+_SERVICE_ID_RE = re.compile(r'(?:Service ID|service_id)[:\s]+(\S+)')
+_BUNDLE_PATH_RE = re.compile(r'(\S+\.orc)\b')
+
+# Process pool for solc compilation so multi-contract compiles run in
+# parallel across cores. Created lazily so processes that never compile
+# do not spawn workers.
+_SOLC_POOL: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+
+def _get_solc_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """Return the shared solc process pool, creating it on first use."""
+    global _SOLC_POOL
+    if _SOLC_POOL is None:
+        _SOLC_POOL = concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, 4))
+    return _SOLC_POOL
+
+
+def _run_solc(sources_input: Dict[str, Any], solidity_version: str) -> Dict[str, Any]:
+    """
+    Run solcx.compile_standard for the given sources.
+
+    Top-level function so it can be pickled into the worker process.
+    """
+    import solcx as worker_solcx
+    return worker_solcx.compile_standard(
+        {
+            "language": "Solidity",
+            "sources": sources_input,
+            "settings": {
+                "outputSelection": {
+                    "*": {
+                        "*": ["abi", "metadata", "evm.bytecode", "evm.sourceMap"]
+                    }
+                }
+            }
+        },
+        solc_version=solidity_version
+    )
+
+
+def _abi_function_set(abi: Any) -> frozenset:
+    """Names of the functions in an ABI, for O(1) membership checks."""
+    try:
+        return frozenset(
+            item["name"] for item in abi
+            if isinstance(item, dict) and item.get("type") == "function")
+    except TypeError:
+        return frozenset()
+
 
 class SapphireClient:
     """
@@ -46,12 +142,33 @@ class SapphireClient:
     confidential smart contracts on the Oasis Sapphire network.
     """
 
+    # Wrapped AsyncWeb3 instances keyed by (network, account address) so
+    # repeated client construction (tests, short-lived scripts) reuses the
+    # provider/middleware/sapphire.wrap setup instead of redoing it.
+    _wrapped_w3_cache: Dict[Tuple[str, str], AsyncWeb3] = {}
+    _w3_cache_lock = threading.Lock()
+
+    # Compiled (abi, bytecode) pairs keyed by (contract name, solc version);
+    # compilation is deterministic and costs seconds, so never redo it in
+    # one process (e.g. compile_contract followed by deploy_contract).
+    _compile_cache: Dict[Tuple[str, str], Tuple[Any, str]] = {}
+    # In-flight compile futures keyed like _compile_cache, used to coalesce
+    # concurrent compile_contract calls for the same contract
+    _compile_futures: Dict[Tuple[str, str], "asyncio.Future"] = {}
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached wrapped web3 instances (mainly for tests)."""
+        with cls._w3_cache_lock:
+            cls._wrapped_w3_cache.clear()
+
     def __init__(self,
                  network: Optional[str] = None,
                  private_key: Optional[str] = None,
                  provider_url: str = "http://localhost:8545",
                  contract_dir: str = None,
-                 default_gas_limit: int = None):
+                 default_gas_limit: int = None,
+                 rpc_concurrency: int = None):
         """
         Initialize the Sapphire client.
         
@@ -61,6 +178,7 @@ class SapphireClient:
             provider_url: URL of the Sapphire node
             contract_dir: Directory containing contract source files
             default_gas_limit: Default gas limit to use for transactions (if None, reads from DEFAULT_GAS_LIMIT env var or defaults to 6,000,000)
+            rpc_concurrency: Maximum number of in-flight RPCs (if None, reads from SAPPHIRE_RPC_CONCURRENCY env var or defaults to 10)
         """
         self.network = network or os.environ.get("OASIS_NETWORK") or "sapphire-localnet"
         self.private_key = private_key or os.environ.get("OASIS_PRIVATE_KEY")
@@ -74,21 +192,95 @@ class SapphireClient:
         
         provider_url = sapphire.NETWORKS[self.network] # Get provider URL
         logger.info("Connecting to Sapphire network '%s' at URL: %s", self.network, provider_url) # Log it
+        self.provider_url = provider_url
 
-        self.w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(provider_url))
-        
-        # Add signing middleware so that eth_sendTransaction calls are
-        # automatically signed and sent as eth_sendRawTransaction.
-        self.w3.middleware_onion.add(SignAndSendRawMiddlewareBuilder.build(self.account))
-        
-        # Now, wrap the w3 instance for Sapphire-specific functionalities.
-        # sapphire.wrap modifies the w3 instance in place and returns it.
-        self.w3 = sapphire.wrap(self.w3, self.account)
-        
-        self.w3.eth.default_account = self.account.address
+        # Shared aiohttp session for raw JSON-RPC batch requests,
+        # created lazily on first use (needs a running event loop).
+        self._http_session: Optional[aiohttp.ClientSession] = None
+
+        w3_cache_key = (self.network, self.account.address)
+        with SapphireClient._w3_cache_lock:
+            cached_w3 = SapphireClient._wrapped_w3_cache.get(w3_cache_key)
 
-        # Contract cache
+        if cached_w3 is not None:
+            self.w3 = cached_w3
+        else:
+            self.w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(provider_url))
+
+            # Let the provider cache responses for immutable requests such
+            # as eth_chainId, so signing middleware stops re-probing the
+            # network on every transaction (static-network behaviour).
+            if hasattr(self.w3.provider, "cache_allowed_requests"):
+                self.w3.provider.cache_allowed_requests = True
+
+            # Add signing middleware so that eth_sendTransaction calls are
+            # automatically signed and sent as eth_sendRawTransaction.
+            self.w3.middleware_onion.add(SignAndSendRawMiddlewareBuilder.build(self.account))
+
+            # Drop the AttributeDict middleware: each receipt/block field is
+            # read exactly once here, so recursively wrapping every response
+            # dict is pure allocation overhead. Plain dicts + subscript
+            # access are used throughout this module instead.
+            try:
+                self.w3.middleware_onion.remove("attrdict")
+            except (KeyError, ValueError):
+                logger.debug("attrdict middleware not present; nothing to remove")
+
+            # Now, wrap the w3 instance for Sapphire-specific functionalities.
+            # sapphire.wrap modifies the w3 instance in place and returns it.
+            self.w3 = sapphire.wrap(self.w3, self.account)
+
+            self.w3.eth.default_account = self.account.address
+
+            with SapphireClient._w3_cache_lock:
+                SapphireClient._wrapped_w3_cache[w3_cache_key] = self.w3
+
+        # Contract cache, plus a secondary index keyed by lowercased address
+        # so ABI lookups in the hot paths are O(1) instead of a linear scan.
         self.contracts = {}
+        self._contracts_by_address: Dict[str, Dict[str, Any]] = {}
+
+        # Cached web3 event objects keyed by (contract_name, event_name) so
+        # receipt processing does not rebuild the contract per call.
+        self._event_processors: Dict[Tuple[str, str], Any] = {}
+
+        # Cached event topic0 hashes keyed the same way; lets receipt
+        # processing filter logs by topic instead of decoding every log.
+        # A None entry means the event is anonymous or not in the ABI.
+        self._event_topics: Dict[Tuple[str, str], Optional[bytes]] = {}
+
+        # Short-lived cache for is_network_ready verdicts so that a single
+        # deploy/transact/receipt flow does not re-probe the node every time.
+        try:
+            self._net_ready_ttl = float(os.environ.get("SAPPHIRE_NET_READY_TTL", "5.0"))
+        except ValueError:
+            logger.warning("Invalid SAPPHIRE_NET_READY_TTL in environment, using default 5.0")
+            self._net_ready_ttl = 5.0
+        self._net_ready_cache: Optional[Tuple[float, bool]] = None
+
+        # Short-lived gas price cache; the price changes at most once per
+        # block, so a burst of transactions can share a single RPC.
+        try:
+            self._gas_price_ttl = float(os.environ.get("SAPPHIRE_GAS_PRICE_TTL", "3.0"))
+        except ValueError:
+            logger.warning("Invalid SAPPHIRE_GAS_PRICE_TTL in environment, using default 3.0")
+            self._gas_price_ttl = 3.0
+        self._gas_price_cache: Optional[Tuple[float, int]] = None
+
+        # Bound the number of in-flight RPCs so parallel callers cannot
+        # hammer the node into rate-limiting (HTTP 429) us.
+        if rpc_concurrency is None:
+            try:
+                rpc_concurrency = int(os.environ.get("SAPPHIRE_RPC_CONCURRENCY", "10"))
+            except ValueError:
+                logger.warning("Invalid SAPPHIRE_RPC_CONCURRENCY in environment, using default 10")
+                rpc_concurrency = 10
+        self._rpc_sem = asyncio.Semaphore(rpc_concurrency)
+
+        # Serialize transaction broadcasts so concurrent sends from the one
+        # account get consecutive nonces; receipt waits still overlap.
+        self._tx_lock = asyncio.Lock()
+
         logger.info("SapphireClient initialized for network: %s", self.network)
 
         # Get default gas limit from parameter, environment, or use default
@@ -113,6 +305,142 @@ class SapphireClient:
         else:
             self.contract_dir = contract_dir
 
+    async def _rpc(self, coro):
+        """
+        Await an outgoing RPC under the client's concurrency limit.
+
+        Args:
+            coro: The awaitable for the RPC call
+
+        Returns:
+            The result of the awaited RPC
+        """
+        async with self._rpc_sem:
+            return await coro
+
+    async def _get_gas_price(self) -> int:
+        """
+        Get the current gas price, cached for a short TTL.
+
+        Returns:
+            The gas price in wei
+        """
+        now = time.monotonic()
+        if self._gas_price_cache is not None and now - self._gas_price_cache[0] < self._gas_price_ttl:
+            return self._gas_price_cache[1]
+        gas_price = await self._rpc(self.w3.eth.gas_price)
+        self._gas_price_cache = (time.monotonic(), gas_price)
+        return gas_price
+
+    def _get_event_processor(self, contract_name: str, event_name: str) -> Any:
+        """
+        Return the cached web3 event object for a contract/event pair.
+
+        The contract instance and the bound event are built once and reused
+        across subsequent receipt-processing calls.
+
+        Args:
+            contract_name: The name of the contract (as stored in self.contracts)
+            event_name: The name of the event
+
+        Returns:
+            The web3 contract event object
+        """
+        key = (contract_name, event_name)
+        event_processor = self._event_processors.get(key)
+        if event_processor is None:
+            contract_data = self.contracts[contract_name]
+            contract_instance = contract_data.get("instance")
+            if contract_instance is None:
+                contract_instance = self.w3.eth.contract(
+                    address=contract_data["address"], abi=contract_data["abi"])
+                contract_data["instance"] = contract_instance
+            event_processor = getattr(contract_instance.events, event_name)
+            self._event_processors[key] = event_processor
+        return event_processor
+
+    def _get_event_topic(self, contract_name: str, event_name: str) -> Optional[bytes]:
+        """
+        Return the cached topic0 hash for a contract/event pair.
+
+        The keccak of the event signature is computed once per pair;
+        receipts can then be pre-filtered by log.topics[0] so only
+        matching logs are decoded.
+
+        Args:
+            contract_name: The name of the contract (as stored in self.contracts)
+            event_name: The name of the event
+
+        Returns:
+            The 32-byte topic hash, or None for anonymous/unknown events
+        """
+        key = (contract_name, event_name)
+        if key not in self._event_topics:
+            topic = None
+            for item in self.contracts[contract_name]["abi"]:
+                if (isinstance(item, dict) and item.get("type") == "event"
+                        and item.get("name") == event_name and not item.get("anonymous")):
+                    signature = f"{event_name}({','.join(inp['type'] for inp in item['inputs'])})"
+                    topic = bytes(AsyncWeb3.keccak(text=signature))
+                    break
+            self._event_topics[key] = topic
+        return self._event_topics[key]
+
+    def set_contract(self,
+                     contract_name: str,
+                     address: str,
+                     abi: Any,
+                     bytecode: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Register a contract in the cache and the address index.
+
+        Use this for externally compiled/deployed contracts so that
+        call_contract/send_transaction can resolve the ABI by address.
+
+        Args:
+            contract_name: The name of the contract
+            address: The deployed contract address
+            abi: The contract ABI
+            bytecode: The compiled contract bytecode (optional)
+
+        Returns:
+            The cached contract entry
+        """
+        entry: Dict[str, Any] = {
+            "address": address,
+            "abi": abi,
+            # O(1) method-availability checks without rescanning the ABI
+            "function_set": _abi_function_set(abi),
+        }
+        if bytecode is not None:
+            entry["bytecode"] = bytecode
+        self.contracts[contract_name] = entry
+        if address:
+            self._contracts_by_address[address.lower()] = entry
+        return entry
+
+    @staticmethod
+    def _load_deployments() -> Dict[str, Any]:
+        """Read the persisted deployment records, tolerating a missing file."""
+        try:
+            with open(_DEPLOYMENTS_PATH, "rb") as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+
+    def _record_deployment(self, code_key: str, address: str) -> None:
+        """Persist a deployed address under its network and code digest."""
+        deployments = self._load_deployments()
+        deployments.setdefault(self.network, {})[code_key] = address
+        try:
+            os.makedirs(os.path.dirname(_DEPLOYMENTS_PATH), exist_ok=True)
+            tmp_path = f"{_DEPLOYMENTS_PATH}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(_json_dumps(deployments))
+            os.replace(tmp_path, _DEPLOYMENTS_PATH)
+        except OSError as e:
+            logger.warning("Could not record deployment in %s: %s", _DEPLOYMENTS_PATH, e)
+
     @staticmethod
     async def compile_contract(contract_name: str,
                                solidity_version: str = "0.8.20") -> Tuple[Any, str]:
@@ -126,11 +454,47 @@ class SapphireClient:
         Returns:
             A tuple of (ABI, bytecode)
         """
+        cache_key = (contract_name, solidity_version)
+        cached = SapphireClient._compile_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Using cached compilation for %s (solc %s)", contract_name, solidity_version)
+            return cached
+
+        # Coalesce concurrent requests: when several tasks ask for the same
+        # contract before the first compile finishes, the later ones await
+        # the in-flight future instead of compiling again
+        pending = SapphireClient._compile_futures.get(cache_key)
+        if pending is not None:
+            logger.info("Awaiting in-flight compilation of %s (solc %s)", contract_name, solidity_version)
+            return await pending
+
+        future = asyncio.get_running_loop().create_future()
+        SapphireClient._compile_futures[cache_key] = future
+        try:
+            result = await SapphireClient._compile_uncached(contract_name, solidity_version)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved in case no other task was waiting
+            future.exception()
+            raise
+        finally:
+            SapphireClient._compile_futures.pop(cache_key, None)
+        future.set_result(result)
+        return result
+
+    @staticmethod
+    async def _compile_uncached(contract_name: str,
+                                solidity_version: str = "0.8.20") -> Tuple[Any, str]:
+        """Compile without consulting the in-process memo (disk cache still applies)."""
+        cache_key = (contract_name, solidity_version)
+
         logger.info("Compiling contract %s with Solidity %s", contract_name, solidity_version)
 
-        # Ensure the Solidity compiler is installed
-        if solcx:
+        # Ensure the Solidity compiler is installed (skip the probe when
+        # this process already knows the version is present)
+        if solcx and solidity_version not in _INSTALLED_SOLC:
             solcx.install_solc(solidity_version)
+            _INSTALLED_SOLC.add(solidity_version)
 
         # Get the contract path
         # Get the directory of the current file (sapphire.py)
@@ -141,42 +505,55 @@ class SapphireClient:
 
         # logger.info("Attempting to load contract from: %s", contract_path) # This was temporarily added
 
-        with open(contract_path, "r") as file:
-            contract_source = file.read()
-
-        # Prepare sources for solcx
-        sources_input = {
-            f"{contract_name}.sol": {"content": contract_source}
-        }
+        def _read_source(path: str) -> str:
+            with open(path, "r") as file:
+                return file.read()
 
-        # If compiling PromiseKeeper, also include PromiseDeposit source for import resolution
+        # If compiling PromiseKeeper, also include PromiseDeposit source for
+        # import resolution. Read the sources off the event loop thread (and
+        # in parallel when there are two of them).
         if contract_name == "PromiseKeeper":
             deposit_contract_path = os.path.join(contract_dir, "PromiseDeposit.sol")
             try:
-                with open(deposit_contract_path, "r") as file:
-                    deposit_contract_source = file.read()
-                sources_input["PromiseDeposit.sol"] = {"content": deposit_contract_source}
-                # logger.info("Added PromiseDeposit.sol to sources for compiling PromiseKeeper.sol") # Optional log
-            except FileNotFoundError:
-                logger.error("Could not find PromiseDeposit.sol to include for PromiseKeeper compilation at %s", deposit_contract_path)
+                contract_source, deposit_contract_source = await asyncio.gather(
+                    asyncio.to_thread(_read_source, contract_path),
+                    asyncio.to_thread(_read_source, deposit_contract_path),
+                )
+            except FileNotFoundError as e:
+                logger.error("Could not find contract source for PromiseKeeper compilation: %s", e.filename)
                 raise # Re-raise the error as it's critical for compilation
+            sources_input = {
+                f"{contract_name}.sol": {"content": contract_source},
+                "PromiseDeposit.sol": {"content": deposit_contract_source},
+            }
+        else:
+            contract_source = await asyncio.to_thread(_read_source, contract_path)
+            sources_input = {
+                f"{contract_name}.sol": {"content": contract_source}
+            }
 
-        # Compile the contract
+        # Check the on-disk cache keyed by source digest + solc version;
+        # SAPPHIRE_COMPILE_CACHE=off forces full recompiles for audits
+        disk_cache_enabled = os.environ.get("SAPPHIRE_COMPILE_CACHE", "on").lower() != "off"
+        digest = hashlib.sha256(solidity_version.encode())
+        for source_name in sorted(sources_input):
+            digest.update(source_name.encode())
+            digest.update(sources_input[source_name]["content"].encode())
+        disk_cache_path = os.path.join(_COMPILE_CACHE_DIR, f"{digest.hexdigest()}.json")
+        if disk_cache_enabled and os.path.exists(disk_cache_path):
+            logger.info("Using on-disk compilation cache for %s", contract_name)
+            with open(disk_cache_path, "rb") as f:
+                cached_output = _json_loads(f.read())
+            abi, bytecode = cached_output["abi"], cached_output["bytecode"]
+            SapphireClient._compile_cache[cache_key] = (abi, bytecode)
+            return abi, bytecode
+
+        # Compile the contract; solc is CPU-bound for seconds, so run it in
+        # the process pool. Parallel compiles of different contracts then
+        # spread across cores instead of queueing on one thread.
         if solcx:
-            compiled_sol = solcx.compile_standard(
-                {
-                    "language": "Solidity",
-                    "sources": sources_input, # Use the prepared sources_input
-                    "settings": {
-                        "outputSelection": {
-                            "*": {
-                                "*": ["abi", "metadata", "evm.bytecode", "evm.sourceMap"]
-                            }
-                        }
-                    }
-                },
-                solc_version=solidity_version
-            )
+            compiled_sol = await asyncio.get_running_loop().run_in_executor(
+                _get_solc_pool(), _run_solc, sources_input, solidity_version)
         else:
             compiled_sol = {}
 
@@ -185,13 +562,26 @@ class SapphireClient:
         abi = contract_data["abi"]
         bytecode = contract_data["evm"]["bytecode"]["object"]
 
+        SapphireClient._compile_cache[cache_key] = (abi, bytecode)
+        if disk_cache_enabled:
+            try:
+                os.makedirs(_COMPILE_CACHE_DIR, exist_ok=True)
+                # Write-then-rename so concurrent compilers never observe a
+                # truncated cache entry
+                tmp_path = f"{disk_cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(_json_dumps({"abi": abi, "bytecode": bytecode}))
+                os.replace(tmp_path, disk_cache_path)
+            except OSError as e:
+                logger.warning("Could not write solc cache %s: %s", disk_cache_path, e)
         return abi, bytecode
 
     async def deploy_contract(self,
                               contract_name: str,
                               contract_bytecode: Optional[str] = None,
                               contract_abi: Optional[Any] = None,
-                              constructor_args: List[Any] = None) -> str:
+                              constructor_args: List[Any] = None,
+                              nonce: Optional[int] = None) -> str:
         """
         Deploy a confidential contract to Oasis Sapphire.
         
@@ -200,6 +590,8 @@ class SapphireClient:
             contract_bytecode: The compiled contract bytecode (optional if compiling)
             contract_abi: The contract ABI (optional if compiling)
             constructor_args: Arguments for the contract constructor
+            nonce: Explicit transaction nonce; lets concurrent deployments
+                use pre-assigned consecutive nonces and land in one block
             
         Returns:
             The address of the deployed contract
@@ -213,6 +605,24 @@ class SapphireClient:
             # And it's a static method, so call it on the class
             contract_abi, contract_bytecode = await SapphireClient.compile_contract(contract_name)
 
+        # Optionally reuse a previous deployment of identical code on a
+        # persistent devnet (SAPPHIRE_REUSE_DEPLOYMENTS=1); keyed on both
+        # the ABI and the bytecode so either changing invalidates the entry
+        reuse_enabled = os.environ.get("SAPPHIRE_REUSE_DEPLOYMENTS") == "1"
+        code_key = None
+        if reuse_enabled:
+            code_key = hashlib.sha256(
+                _json_dumps(contract_abi) + contract_bytecode.encode()
+            ).hexdigest()
+            recorded_address = self._load_deployments().get(self.network, {}).get(code_key)
+            if recorded_address:
+                code = await self._rpc(self.w3.eth.get_code(recorded_address))
+                if code:
+                    logger.info("Reusing existing %s deployment at %s", contract_name, recorded_address)
+                    self.set_contract(contract_name, recorded_address, contract_abi, bytecode=contract_bytecode)
+                    return recorded_address
+                logger.info("Recorded %s deployment at %s has no code; redeploying", contract_name, recorded_address)
+
         # Create the contract instance
         contract = self.w3.eth.contract(abi=contract_abi, bytecode=contract_bytecode)
 
@@ -220,32 +630,36 @@ class SapphireClient:
         if constructor_args is None:
             constructor_args = []
 
-        # Deploy the contract
-        gas_price = await self.w3.eth.gas_price
-        await self.is_network_ready()
+        # Deploy the contract; the gas price fetch and readiness probe are
+        # independent RPCs, so run them concurrently.
+        gas_price, _ = await asyncio.gather(self._get_gas_price(), self.is_network_ready())
         
         logger.info("Sending constructor transaction for %s with gas limit: %d", contract_name, self.default_gas_limit)
-        tx_hash = await contract.constructor(*constructor_args).transact({
+        deploy_tx_params = {
             "gasPrice": gas_price,
             "gas": self.default_gas_limit  # Use the default gas limit
-        })
+        }
+        if nonce is not None:
+            deploy_tx_params["nonce"] = nonce
+        async with self._tx_lock:
+            tx_hash = await self._rpc(contract.constructor(*constructor_args).transact(deploy_tx_params))
         logger.info("Deployment transaction for %s sent, hash: %s", contract_name, tx_hash.hex())
 
         # Wait for the transaction receipt
         logger.info("Waiting for transaction receipt for %s deployment...", contract_name)
-        tx_receipt = await self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        tx_receipt = await self._rpc(self.w3.eth.wait_for_transaction_receipt(tx_hash))
         
-        if tx_receipt.status == 0:
+        if tx_receipt["status"] == 0:
             logger.error("Contract %s deployment failed. Transaction status is 0. Receipt: %s", contract_name, tx_receipt)
             raise Exception(f"Contract {contract_name} deployment failed. Transaction status is 0.")
 
-        contract_address = tx_receipt.contractAddress
+        contract_address = tx_receipt["contractAddress"]
         if not contract_address:
             logger.error("Contract %s deployment failed. No contract address in receipt. Receipt: %s", contract_name, tx_receipt)
             raise Exception(f"Contract {contract_name} deployment failed. No contract address in receipt.")
 
         logger.info("Contract %s deployed successfully at address: %s. Gas used: %d", 
-                    contract_name, contract_address, tx_receipt.gasUsed)
+                    contract_name, contract_address, tx_receipt["gasUsed"])
 
         # Cache the contract
         self.contracts[contract_name] = {
@@ -254,9 +668,17 @@ class SapphireClient:
             "bytecode": contract_bytecode,
             "constructor_args": constructor_args,
             "deploy_tx_hash": tx_hash.hex(),
-            "deploy_gas_used": tx_receipt.gasUsed # Store gas used
+            "deploy_gas_used": tx_receipt["gasUsed"], # Store gas used
+            # Reusable web3 contract instance bound to the deployed address
+            "instance": self.w3.eth.contract(address=contract_address, abi=contract_abi),
+            # O(1) method-availability checks without rescanning the ABI
+            "function_set": _abi_function_set(contract_abi)
         }
-        
+        self._contracts_by_address[contract_address.lower()] = self.contracts[contract_name]
+
+        if reuse_enabled and code_key:
+            self._record_deployment(code_key, contract_address)
+
         return contract_address
 
     async def call_contract(self,
@@ -281,17 +703,22 @@ class SapphireClient:
         logger.info("Calling %s on contract %s...", method_name, contract_address)
 
         # Get the contract ABI
+        cached_contract = self._contracts_by_address.get(contract_address.lower())
         if not abi:
-            for cached_contract in self.contracts.values():
-                if cached_contract["address"].lower() == contract_address.lower():
-                    abi = cached_contract["abi"]
-                    break
+            if cached_contract is not None:
+                abi = cached_contract["abi"]
 
             if not abi:
                 raise ValueError(f"No ABI found for contract at {contract_address}")
 
-        # Create the contract instance
-        contract = self.w3.eth.contract(address=contract_address, abi=abi)
+        # Reuse the cached bound contract instance when it matches the ABI
+        # in use; building a fresh instance re-parses the ABI per call
+        if (cached_contract is not None
+                and cached_contract.get("instance") is not None
+                and cached_contract["abi"] is abi):
+            contract = cached_contract["instance"]
+        else:
+            contract = self.w3.eth.contract(address=contract_address, abi=abi)
 
         # Prepare arguments
         if args is None:
@@ -299,10 +726,29 @@ class SapphireClient:
 
         # Call the method
         method = getattr(contract.functions, method_name)
-        result = await method(*args).call({"value": value})
+        result = await self._rpc(method(*args).call({"value": value}))
 
         return result
 
+    async def multi_call(self, calls: List[Tuple[str, str, List[Any]]]) -> List[Any]:
+        """
+        Execute several read-only contract calls concurrently.
+
+        Each call resolves its ABI from the contract cache. The calls go
+        out as overlapping eth_call requests on the shared connection, so
+        the wall time is one round-trip instead of one per read.
+
+        Args:
+            calls: A list of (contract_address, method_name, args) tuples
+
+        Returns:
+            The call results, in the same order as the input
+        """
+        return await asyncio.gather(*[
+            self.call_contract(contract_address=address, method_name=method_name, args=call_args)
+            for address, method_name, call_args in calls
+        ])
+
     async def is_network_ready(self) -> bool:
         """
         Check if the network is ready to process transactions.
@@ -316,21 +762,142 @@ class SapphireClient:
         Returns:
             True if the network appears ready, False otherwise
         """
+        # Return the cached verdict if it is still fresh; the underlying
+        # conditions change slowly compared to a deploy+transact flow.
+        if self._net_ready_cache is not None:
+            cached_at, cached_verdict = self._net_ready_cache
+            if time.monotonic() - cached_at < self._net_ready_ttl:
+                return cached_verdict
+
+        verdict = await self._check_network_ready()
+        self._net_ready_cache = (time.monotonic(), verdict)
+        return verdict
+
+    async def _get_http_session(self) -> aiohttp.ClientSession:
+        """
+        Return this client's aiohttp session, creating it on first use.
+
+        The session uses a persistent keep-alive connector so every raw
+        RPC reuses a live TCP/TLS connection instead of paying a handshake
+        per call. The pool size is configurable via SAPPHIRE_HTTP_POOL.
+
+        The session is deliberately NOT registered on the web3 provider:
+        the wrapped w3 is shared between clients via _wrapped_w3_cache, so
+        caching a per-instance session there would let one client's
+        close() tear down a session other live clients still depend on.
+        The provider manages its own internal keep-alive session instead.
+        """
+        if self._http_session is None or self._http_session.closed:
+            try:
+                pool_size = int(os.environ.get("SAPPHIRE_HTTP_POOL", "32"))
+            except ValueError:
+                logger.warning("Invalid SAPPHIRE_HTTP_POOL in environment, using default 32")
+                pool_size = 32
+            connector = aiohttp.TCPConnector(
+                limit=pool_size,
+                keepalive_timeout=60,
+                ttl_dns_cache=300
+            )
+            self._http_session = aiohttp.ClientSession(connector=connector)
+        return self._http_session
+
+    async def close(self) -> None:
+        """Close this client's aiohttp session and its connection pool.
+
+        Only instance-owned resources are released; the wrapped w3 shared
+        through _wrapped_w3_cache stays usable for other clients.
+        """
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+
+    async def __aenter__(self) -> "SapphireClient":
+        """Support `async with SapphireClient() as client:` usage."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close the pooled HTTP session when the context exits."""
+        await self.close()
+
+    async def _check_network_ready(self) -> bool:
+        """
+        Perform the actual network readiness probes (uncached).
+
+        The three probes are issued as a single JSON-RPC 2.0 batch request,
+        collapsing three HTTP round-trips into one. If the node rejects
+        batch requests, fall back to individual web3 calls.
+        """
+        try:
+            batch = [
+                {"jsonrpc": "2.0", "id": 1, "method": "eth_syncing", "params": []},
+                {"jsonrpc": "2.0", "id": 2, "method": "eth_getBlockByNumber", "params": ["latest", False]},
+                {"jsonrpc": "2.0", "id": 3, "method": "eth_getBlockTransactionCountByNumber", "params": ["pending"]},
+            ]
+            session = await self._get_http_session()
+            async with self._rpc_sem:
+                async with session.post(self.provider_url, json=batch) as response:
+                    response.raise_for_status()
+                    results = await response.json()
+            if not isinstance(results, list):
+                raise ValueError("Node did not return a JSON-RPC batch response")
+            by_id = {item.get("id"): item for item in results}
+            for probe_id in (1, 2, 3):
+                if probe_id not in by_id or "error" in by_id[probe_id]:
+                    raise ValueError(f"Batch probe {probe_id} failed: {by_id.get(probe_id)}")
+            syncing = by_id[1]["result"]
+            latest_block = by_id[2]["result"]
+            pending_count = int(by_id[3]["result"], 16)
+        except Exception as e:
+            logger.warning("Batched readiness probe failed (%s). Falling back to individual RPCs.", e)
+            return await self._check_network_ready_individual()
+
+        # Check if the node is syncing
+        if syncing:
+            logger.warning(
+                "Blockchain is still syncing. Current block: %s, Highest block: %s",
+                syncing.get('currentBlock', 'unknown'),
+                syncing.get('highestBlock', 'unknown')
+            )
+            return False
+
+        # Check if the latest block is recent enough
+        block_timestamp = int(latest_block["timestamp"], 16)
+        current_time = int(time.time())
+        if current_time - block_timestamp > 120:
+            logger.warning(
+                "Latest block is too old (%s seconds). Network may not be ready.",
+                current_time - block_timestamp
+            )
+            return False
+        logger.info("Latest block height: %s, timestamp: %s", int(latest_block["number"], 16), block_timestamp)
+
+        # Check pending transaction count
+        if pending_count > 500:  # Arbitrary threshold
+            logger.warning("High pending transaction count: %s", pending_count)
+            return False
+        logger.info("Current pending transaction count: %s", pending_count)
+
+        logger.info("Network appears ready for transactions")
+        return True
+
+    async def _check_network_ready_individual(self) -> bool:
+        """Probe network readiness with individual web3 calls (batch fallback)."""
         try:
             # Check if the node is syncing
-            syncing = await self.w3.eth.syncing
+            syncing = await self._rpc(self.w3.eth.syncing)
             if syncing:
+                sync_info = syncing if isinstance(syncing, dict) else {}
                 logger.warning(
                     "Blockchain is still syncing. Current block: %s, Highest block: %s",
-                    syncing.get('currentBlock', 'unknown'),
-                    syncing.get('highestBlock', 'unknown')
+                    sync_info.get('currentBlock', 'unknown'),
+                    sync_info.get('highestBlock', 'unknown')
                 )
                 return False
                 
             # Check if the latest block is recent enough
             try:
-                latest_block = await self.w3.eth.get_block('latest')
-                block_timestamp = latest_block.timestamp
+                latest_block = await self._rpc(self.w3.eth.get_block('latest'))
+                block_timestamp = latest_block["timestamp"]
                 current_time = int(time.time())
                 
                 # If latest block is older than 2 minutes, network may not be ready
@@ -344,14 +911,14 @@ class SapphireClient:
                 # Check block height differences between analyzers
                 # This is specific to Sapphire's dual-analyzer architecture
                 # In a production environment, you might query this differently
-                logger.info("Latest block height: %s, timestamp: %s", latest_block.number, block_timestamp)
+                logger.info("Latest block height: %s, timestamp: %s", latest_block["number"], block_timestamp)
             except Exception as e:
                 logger.warning("Error checking latest block: %s", e)
                 # Continue even if this check fails
                 
             # Check pending transaction count
             try:
-                pending_count = await self.w3.eth.get_block_transaction_count('pending')
+                pending_count = await self._rpc(self.w3.eth.get_block_transaction_count('pending'))
                 if pending_count > 500:  # Arbitrary threshold
                     logger.warning("High pending transaction count: %s", pending_count)
                     return False
@@ -376,10 +943,11 @@ class SapphireClient:
                                abi: Optional[Any] = None,
                                value: int = 0,
                                gas_limit: Optional[int] = None,
-                               check_network_ready: bool = True) -> str:
+                               check_network_ready: bool = True,
+                               nonce: Optional[int] = None) -> str:
         """
         Send a transaction to a confidential contract.
-        
+
         Args:
             contract_address: The address of the contract
             method_name: The name of the method to call
@@ -388,161 +956,214 @@ class SapphireClient:
             value: Amount of tokens to send with the transaction
             gas_limit: Optional gas limit for the transaction
             check_network_ready: Whether to check if the network is ready before sending
-            
+            nonce: Explicit transaction nonce; lets callers queue several
+                writes with pre-assigned consecutive nonces and await the
+                receipts together
+
         Returns:
             The transaction hash
         """
         logger.info("Sending transaction to %s on contract %s...", method_name, contract_address)
 
-        # Check if the network is ready
-        if check_network_ready:
-            network_ready = await self.is_network_ready()
-            if not network_ready:
-                logger.warning("Network does not appear ready. Transaction may fail or be dropped.")
-                # We continue anyway but have logged the warning
-
-        # Get the contract ABI
+        # Get the contract ABI first: raising out of this method must not
+        # leave background tasks running
+        cached_contract = self._contracts_by_address.get(contract_address.lower())
         if not abi:
-            for cached_contract in self.contracts.values():
-                if cached_contract["address"].lower() == contract_address.lower():
-                    abi = cached_contract["abi"]
-                    break
+            if cached_contract is not None:
+                abi = cached_contract["abi"]
 
             if not abi:
                 raise ValueError(f"No ABI found for contract at {contract_address}")
 
-        # Create the contract instance
-        contract = self.w3.eth.contract(address=contract_address, abi=abi)
+        # Kick off the readiness probe and gas price fetch concurrently;
+        # they are independent RPCs and can overlap the contract-instance
+        # resolution below.
+        ready_task = asyncio.create_task(self.is_network_ready()) if check_network_ready else None
+        gas_price_task = asyncio.create_task(self._get_gas_price())
+
+        # Reuse the cached bound contract instance when it matches the ABI
+        # in use; building a fresh instance re-parses the ABI per call
+        if (cached_contract is not None
+                and cached_contract.get("instance") is not None
+                and cached_contract["abi"] is abi):
+            contract = cached_contract["instance"]
+        else:
+            contract = self.w3.eth.contract(address=contract_address, abi=abi)
 
         # Prepare arguments
         if args is None:
             args = []
 
         # Send the transaction
-        gas_price = await self.w3.eth.gas_price
+        gas_price = await gas_price_task
+        if ready_task is not None and not await ready_task:
+            logger.warning("Network does not appear ready. Transaction may fail or be dropped.")
+            # We continue anyway but have logged the warning
         method = getattr(contract.functions, method_name)
         
         tx_params = {"gasPrice": gas_price, "value": value}
+        if nonce is not None:
+            tx_params["nonce"] = nonce
         if gas_limit:
             tx_params["gas"] = gas_limit
             logger.info("Using explicit gas limit for transaction: %s", gas_limit)
         else:
-            # Use the default gas limit
-            tx_params["gas"] = self.default_gas_limit
-            logger.info("Using default gas limit for transaction: %s", self.default_gas_limit)
+            # Estimate and pad by 20%, capped at the configured default, so
+            # simple calls stop paying the worst-case limit up front. Fall
+            # back to the default when the node cannot estimate (e.g.
+            # confidential calldata).
+            try:
+                estimated = await self._rpc(method(*args).estimate_gas({"value": value}))
+                tx_params["gas"] = min(int(estimated * 1.2), self.default_gas_limit)
+                logger.info("Using estimated gas limit for transaction: %s", tx_params["gas"])
+            except Exception as e:
+                logger.warning("Gas estimation failed (%s); using default gas limit %d", e, self.default_gas_limit)
+                tx_params["gas"] = self.default_gas_limit
 
-        tx_hash = await method(*args).transact(tx_params)
+        async with self._tx_lock:
+            tx_hash = await self._rpc(method(*args).transact(tx_params))
 
         logger.info("Transaction sent: %s", tx_hash.hex())
         return tx_hash.hex()
 
+    async def ensure_deposit_contract(self,
+                                      keeper_address: str,
+                                      deposit_address: str,
+                                      abi: Optional[Any] = None) -> bool:
+        """
+        Wire the deposit contract into a keeper only if not already set.
+
+        A cheap eth_call against the depositContractAddress getter (the
+        public state variable in PromiseKeeper/MinimalPromiseKeeper)
+        replaces an unconditional state-changing transaction on re-runs.
+
+        Args:
+            keeper_address: The PromiseKeeper contract address
+            deposit_address: The PromiseDeposit contract address
+            abi: The keeper ABI (optional if the contract is cached)
+
+        Returns:
+            True if a setDepositContract transaction was sent
+        """
+        getter = "depositContractAddress"
+        cached_contract = self._contracts_by_address.get(keeper_address.lower())
+        function_set = (cached_contract or {}).get("function_set")
+        if function_set is None and abi is not None:
+            function_set = _abi_function_set(abi)
+
+        current = None
+        if function_set is not None and getter not in function_set:
+            # Keeper variant without the public state variable; nothing to
+            # read, so fall through to sending the setter
+            logger.info("Keeper ABI has no %s getter; sending setter", getter)
+        else:
+            try:
+                current = await self.call_contract(
+                    contract_address=keeper_address,
+                    method_name=getter,
+                    abi=abi
+                )
+            except Exception as e:
+                logger.warning("Could not read current deposit contract (%s); sending setter", e)
+
+        if current and current.lower() == deposit_address.lower():
+            logger.info("Deposit contract already set to %s; skipping setDepositContract", deposit_address)
+            return False
+
+        await self.send_transaction(
+            contract_address=keeper_address,
+            method_name="setDepositContract",
+            args=[deposit_address],
+            abi=abi
+        )
+        return True
+
     async def get_event_from_receipt(self, tx_hash: str, contract_name_for_abi: str, event_name: str, 
-                                    max_attempts: int = 5, initial_timeout: int = 30) -> Optional[Dict[str, Any]]:
+                                    max_attempts: int = 5, initial_timeout: int = 30,
+                                    return_receipt: bool = False) -> Optional[Dict[str, Any]]:
         """
-        Waits for a transaction receipt and extracts arguments from a specific event with improved retry logic.
+        Waits for a transaction receipt and extracts arguments from a specific event.
+
+        A single bounded receipt wait is used instead of layered retry loops;
+        max_attempts and initial_timeout together define the overall time
+        budget (max_attempts * initial_timeout seconds).
 
         Args:
             tx_hash: The hash of the transaction.
             contract_name_for_abi: The name of the contract (as stored in self.contracts) to get ABI for event decoding.
             event_name: The name of the event to look for.
-            max_attempts: Maximum number of attempts to get the receipt.
-            initial_timeout: Initial timeout in seconds for the first attempt.
+            max_attempts: Multiplier for the overall receipt timeout.
+            initial_timeout: Base timeout in seconds.
+            return_receipt: When True, return (event_args, receipt) so callers
+                that also need the receipt skip a second eth_getTransactionReceipt.
 
         Returns:
             A dictionary of event arguments if the event is found, otherwise None.
+            With return_receipt=True, an (event_args, receipt) tuple instead.
         """
         logger.info("Waiting for receipt for tx %s to get event '%s'...", tx_hash, event_name)
-        
+
         # Check if the network is ready before waiting for receipt
         network_ready = await self.is_network_ready()
         if not network_ready:
             logger.warning("Network may not be ready. Transaction receipt retrieval might be delayed.")
-        
-        for attempt in range(1, max_attempts + 1):
-            # Calculate timeout with exponential backoff
-            timeout = initial_timeout * (2 ** (attempt - 1))
-            
+
+        if contract_name_for_abi not in self.contracts:
+            logger.error("ABI for contract '%s' not found in cache.", contract_name_for_abi)
+            return (None, None) if return_receipt else None
+
+        # Adaptive polling: a tight initial interval catches fast blocks at
+        # ~one block time of latency, then backs off to a one-second
+        # ceiling (Sapphire finalizes in about a second, so polling less
+        # often than that just adds latency) until the deadline expires.
+        overall_timeout = initial_timeout * max_attempts
+        deadline = time.monotonic() + overall_timeout
+        poll_interval = 0.1
+        tx_receipt = None
+        while True:
             try:
-                logger.info("Attempt %d/%d: Waiting for receipt with timeout %d seconds...", 
-                           attempt, max_attempts, timeout)
-                
-                # Try to get the transaction first to see if it exists
-                try:
-                    tx = await self.w3.eth.get_transaction(tx_hash)
-                    if tx is None:
-                        logger.warning("Transaction %s not found in mempool. It may have been dropped.", tx_hash)
-                        # If we're on the last attempt, return None
-                        if attempt == max_attempts:
-                            return None
-                        # Otherwise wait and try again
-                        await asyncio.sleep(timeout)
-                        continue
-                except Exception as e:
-                    logger.warning("Error checking transaction %s: %s", tx_hash, e)
-                
-                # Try to get the receipt
-                tx_receipt = await self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
-                
-                if tx_receipt.status == 0:
-                    logger.error("Transaction %s failed (status 0). No events to process.", tx_hash)
-                    return None
-                
-                # Process the receipt
-                if contract_name_for_abi not in self.contracts:
-                    logger.error("ABI for contract '%s' not found in cache.", contract_name_for_abi)
-                    return None
-                
-                contract_data = self.contracts[contract_name_for_abi]
-                contract_abi = contract_data["abi"]
-                contract_address = contract_data["address"]
-                
-                contract_instance = self.w3.eth.contract(address=contract_address, abi=contract_abi)
-                
-                try:
-                    processed_events = getattr(contract_instance.events, event_name)().process_receipt(tx_receipt)
-                    if processed_events:
-                        event_args = processed_events[0]['args']
-                        logger.info("Found event '%s' with args: %s", event_name, event_args)
-                        return event_args
-                    else:
-                        logger.warning("Event '%s' not found in transaction %s logs.", event_name, tx_hash)
-                        # The transaction was successful but didn't emit the expected event
-                        # This is a different issue than a timeout, so we return None
-                        return None
-                except Exception as e:
-                    logger.error("Error processing event '%s' for tx %s: %s", event_name, tx_hash, e)
-                    return None
-                    
-            except asyncio.TimeoutError:
-                logger.warning("Attempt %d/%d: Timeout waiting for receipt for %s", 
-                              attempt, max_attempts, tx_hash)
-                
-                # If this is the last attempt, give up
-                if attempt == max_attempts:
-                    logger.error("All attempts failed. Giving up on transaction %s", tx_hash)
-                    return None
-                
-                # Otherwise, check if the transaction is still in the mempool
-                try:
-                    tx = await self.w3.eth.get_transaction(tx_hash)
-                    if tx is None:
-                        logger.warning("Transaction %s not found in mempool after timeout. It may have been dropped.", tx_hash)
-                    else:
-                        logger.info("Transaction %s is still in mempool. Will retry...", tx_hash)
-                except Exception as e:
-                    logger.warning("Error checking transaction %s after timeout: %s", tx_hash, e)
-            
-            except Exception as e:
-                logger.error("Unexpected error waiting for receipt for %s: %s", tx_hash, e)
-                # If this is the last attempt, give up
-                if attempt == max_attempts:
-                    return None
-            
-            # Wait before retrying
-            await asyncio.sleep(5)  # Short delay between attempts
-        
-        # If we get here, all attempts failed
-        return None
+                tx_receipt = await self._rpc(self.w3.eth.get_transaction_receipt(tx_hash))
+            except Exception:
+                tx_receipt = None  # Not mined yet
+            if tx_receipt is not None and tx_receipt.get("blockNumber") is not None:
+                break
+            if time.monotonic() >= deadline:
+                logger.error("Timed out after %d seconds waiting for receipt for %s", overall_timeout, tx_hash)
+                return (None, None) if return_receipt else None
+            await asyncio.sleep(poll_interval)
+            poll_interval = min(poll_interval * 1.5, 1.0)
+
+        if tx_receipt["status"] == 0:
+            logger.error("Transaction %s failed (status 0). No events to process.", tx_hash)
+            return (None, tx_receipt) if return_receipt else None
+
+        event_processor = self._get_event_processor(contract_name_for_abi, event_name)
+        topic0 = self._get_event_topic(contract_name_for_abi, event_name)
+
+        try:
+            if topic0 is not None:
+                # Pre-filter the logs by the cached topic hash so only the
+                # matching log is ABI-decoded, instead of attempting to
+                # decode every log in the receipt
+                matching_logs = [
+                    log for log in tx_receipt["logs"]
+                    if log["topics"] and bytes(log["topics"][0]) == topic0
+                ]
+                processed_events = [event_processor().process_log(log) for log in matching_logs]
+            else:
+                # Anonymous or unknown event; fall back to scanning the receipt
+                processed_events = event_processor().process_receipt(tx_receipt)
+            if processed_events:
+                event_args = processed_events[0]['args']
+                logger.info("Found event '%s' with args: %s", event_name, event_args)
+                return (event_args, tx_receipt) if return_receipt else event_args
+            else:
+                logger.warning("Event '%s' not found in transaction %s logs.", event_name, tx_hash)
+                # The transaction was successful but didn't emit the expected event
+                return (None, tx_receipt) if return_receipt else None
+        except Exception as e:
+            logger.error("Error processing event '%s' for tx %s: %s", event_name, tx_hash, e)
+            return (None, tx_receipt) if return_receipt else None
 
 
 class SecureDataHandler:
@@ -562,8 +1183,28 @@ class SecureDataHandler:
         """
         self.sapphire_client = sapphire_client
         self.w3 = sapphire_client.w3
+
+        # Pool of random bytes for nonces; drawn from the kernel RNG in
+        # large chunks so bulk encryption amortizes the syscall cost.
+        self._nonce_pool = bytearray()
+        self._nonce_lock = asyncio.Lock()
+
         logger.info("SecureDataHandler initialized")
 
+    async def _fresh_nonce(self) -> bytes:
+        """
+        Return a fresh 24-byte nonce.
+
+        Refills the pool in 4 KiB chunks, so one os.urandom syscall covers
+        roughly 170 encryptions.
+        """
+        async with self._nonce_lock:
+            if len(self._nonce_pool) < 24:
+                self._nonce_pool.extend(os.urandom(4096))
+            nonce = bytes(self._nonce_pool[:24])
+            del self._nonce_pool[:24]
+        return nonce
+
     async def encrypt_data(self, data: Dict[str, Any]) -> str:
         """
         Encrypt data for secure storage or transmission using Sapphire's encryption.
@@ -575,24 +1216,28 @@ class SecureDataHandler:
             The encrypted data as a string
         """
         # Convert data to JSON string
-        data_str = json.dumps(data)
+        data_str = _json_dumps(data).decode()
 
         # Deploy a temporary contract for encryption if needed
         # In a production implementation, you'd use a dedicated encryption contract
 
         # For now, we'll use a simple approach with the web3 instance's encryption
-        nonce = os.urandom(24).hex()  # Generate a random nonce
+        nonce = await self._fresh_nonce()  # Generate a random nonce
         context = "self-promise-encryption"
 
         # Use Sapphire's encryption through web3 middleware
         encrypted_data = self.w3.sapphire.encrypt(data_str, nonce, context)
 
-        # Return the encrypted data along with the nonce for later decryption
-        return json.dumps({
-            "encrypted": encrypted_data.hex() if isinstance(encrypted_data, bytes) else encrypted_data,
-            "nonce": nonce,
+        # Return the encrypted data along with the nonce for later
+        # decryption. Base64 is ~33% smaller than hex and its codec is
+        # C-level; "v": 2 distinguishes this from legacy hex envelopes.
+        return _json_dumps({
+            "v": 2,
+            "encrypted": base64.b64encode(encrypted_data).decode()
+                         if isinstance(encrypted_data, bytes) else encrypted_data,
+            "nonce": base64.b64encode(nonce).decode(),
             "context": context
-        })
+        }).decode()
 
     async def decrypt_data(self, encrypted_data: str) -> Dict[str, Any]:
         """
@@ -605,20 +1250,25 @@ class SecureDataHandler:
             The decrypted data
         """
         # Parse the encrypted data JSON
-        data = json.loads(encrypted_data)
+        data = _json_loads(encrypted_data)
         encrypted = data["encrypted"]
-        nonce = data["nonce"]
         context = data["context"]
 
-        # Convert hex string to bytes if needed
-        if isinstance(encrypted, str):
-            encrypted = bytes.fromhex(encrypted)
+        if data.get("v", 1) >= 2:
+            nonce = base64.b64decode(data["nonce"])
+            if isinstance(encrypted, str):
+                encrypted = base64.b64decode(encrypted)
+        else:
+            # Legacy envelope: hex-encoded ciphertext, hex-string nonce
+            nonce = data["nonce"]
+            if isinstance(encrypted, str):
+                encrypted = bytes.fromhex(encrypted)
 
         # Decrypt the data using Sapphire's decryption
         decrypted_data = self.w3.sapphire.decrypt(encrypted, nonce, context)
 
         # Parse the decrypted JSON
-        return json.loads(decrypted_data)
+        return _json_loads(decrypted_data)
 
     async def secure_compute(self,
                              function: Callable,
@@ -655,11 +1305,14 @@ class SecureDataHandler:
 
         if attestation:
             # Generate a simulated attestation
-            # In a real implementation, this would be generated by the TEE
+            # In a real implementation, this would be generated by the TEE.
+            # Hash the serialized bytes directly instead of going through
+            # the w3.keccak text wrapper, which re-encodes per call.
+            result_bytes = _json_dumps(result)
             attestation_data = {
                 "tee_type": "Sapphire",
                 "timestamp": int(time.time()),
-                "signature": self.w3.keccak(text=json.dumps(result)).hex()
+                "signature": keccak(result_bytes).hex()
             }
 
             result["attestation"] = attestation_data
@@ -699,13 +1352,20 @@ class ROFLClient:
 
         logger.info("ROFLClient initialized for network: %s", self.network)
 
+    # Results of idempotent read-only commands, cached per argv
+    _read_command_cache: Dict[Tuple[str, ...], str] = {}
+
     @staticmethod
-    def _run_oasis_command(command: List[str]) -> str:
+    async def _run_oasis_command(command: List[str],
+                                 input_data: Optional[bytes] = None,
+                                 cwd: Optional[str] = None) -> str:
         """
-        Run an Oasis CLI command.
+        Run an Oasis CLI command without blocking the event loop.
         
         Args:
             command: The command parts to run
+            input_data: Optional bytes to pipe to the command's stdin
+            cwd: Optional working directory for the command
             
         Returns:
             The command output
@@ -713,19 +1373,40 @@ class ROFLClient:
         full_command = ["oasis"] + command
         logger.info("Running Oasis command: %s", " ".join(full_command))
 
-        try:
-            result = subprocess.run(
-                full_command,
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            return result.stdout.strip()
-        except subprocess.CalledProcessError as e:
-            logger.error("Oasis command failed: %s", e.stderr)
-            raise RuntimeError(f"Oasis command failed: {e.stderr}")
+        proc = await asyncio.create_subprocess_exec(
+            *full_command,
+            stdin=asyncio.subprocess.PIPE if input_data is not None else None,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd
+        )
+        stdout, stderr = await proc.communicate(input=input_data)
+        if proc.returncode != 0:
+            error_output = stderr.decode()
+            logger.error("Oasis command failed: %s", error_output)
+            raise RuntimeError(f"Oasis command failed: {error_output}")
+        return stdout.decode().strip()
+
+    @classmethod
+    async def _run_oasis_command_cached(cls, command: Tuple[str, ...]) -> str:
+        """
+        Run an idempotent read-only Oasis CLI command, cached per argv.
+
+        Spawning the oasis binary costs tens to hundreds of milliseconds;
+        read-only commands such as "rofl show" can reuse the first result
+        within a process.
+
+        Args:
+            command: The command parts to run, as a hashable tuple
 
-    def init_rofl_config(self, directory: str = "./") -> str:
+        Returns:
+            The command output
+        """
+        if command not in cls._read_command_cache:
+            cls._read_command_cache[command] = await cls._run_oasis_command(list(command))
+        return cls._read_command_cache[command]
+
+    async def init_rofl_config(self, directory: str = "./") -> str:
         """
         Initialize ROFL configuration.
         
@@ -735,24 +1416,31 @@ class ROFLClient:
         Returns:
             The path to the created rofl.yaml file
         """
-        os.chdir(directory)
-        output = self._run_oasis_command(["rofl", "init"])
-        logger.info("ROFL config initialized: %s", output)
+        output = await self._run_oasis_command(["rofl", "init"], cwd=directory)
+        logger.info("ROFL config initialized (%d bytes of output)", len(output))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ROFL config init output: %s", output)
         return os.path.join(directory, "rofl.yaml")
 
-    def create_rofl_service(self) -> str:
+    async def create_rofl_service(self, directory: Optional[str] = None) -> str:
         """
         Register a ROFL service on-chain.
         
+        Args:
+            directory: The service directory to run in (defaults to cwd)
+            
         Returns:
             The service ID
         """
-        output = self._run_oasis_command(["rofl", "create"])
-        logger.info("ROFL service created: %s", output)
-
-        # Extract service ID from output
-        # Assuming output format contains the service ID
-        service_id = output.strip().split()[-1]
+        output = await self._run_oasis_command(["rofl", "create"], cwd=directory)
+        logger.info("ROFL service created (%d bytes of output)", len(output))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ROFL create output: %s", output)
+
+        # Extract service ID from output, falling back to the last token
+        # when the expected "Service ID:" line is absent
+        match = _SERVICE_ID_RE.search(output)
+        service_id = match.group(1) if match else output.rsplit(None, 1)[-1]
         return service_id
 
     @staticmethod
@@ -764,68 +1452,83 @@ class ROFLClient:
             name: The name of the secret
             value: The value of the secret
         """
-        # Use echo to pipe the value to stdin
-        cmd = f'echo -n "{value}" | oasis rofl secret set {name} -'
-
+        # Pipe the value via stdin; no shell, so no quoting issues and no
+        # extra shell process per call
         try:
-            subprocess.run(cmd, shell=True, check=True)
+            subprocess.run(
+                ["oasis", "rofl", "secret", "set", name, "-"],
+                input=value.encode(),
+                check=True
+            )
             logger.info("Secret %s set", name)
         except subprocess.CalledProcessError as e:
             logger.error("Failed to set secret: %s", e)
             raise RuntimeError(f"Failed to set secret: {e}")
 
-    def build_rofl_bundle(self) -> str:
+    async def build_rofl_bundle(self, directory: Optional[str] = None) -> str:
         """
         Build a ROFL bundle.
         
+        Args:
+            directory: The service directory to run in (defaults to cwd)
+            
         Returns:
             The path to the built .orc file
         """
-        output = self._run_oasis_command(["rofl", "build"])
-        logger.info("ROFL bundle built: %s", output)
-
-        # Extract file path from output
-        # This is a simplification - actual output format may vary
-        bundle_path = output.strip().split()[-1]
+        output = await self._run_oasis_command(["rofl", "build"], cwd=directory)
+        logger.info("ROFL bundle built (%d bytes of output)", len(output))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ROFL build output: %s", output)
+
+        # Extract the .orc file path from output, falling back to the last
+        # token when no such path is present
+        match = _BUNDLE_PATH_RE.search(output)
+        bundle_path = match.group(1) if match else output.rsplit(None, 1)[-1]
         return bundle_path
 
-    def update_rofl_service(self) -> None:
+    async def update_rofl_service(self, directory: Optional[str] = None) -> None:
         """
         Update ROFL service on-chain.
+        
+        Args:
+            directory: The service directory to run in (defaults to cwd)
         """
-        output = self._run_oasis_command(["rofl", "update"])
-        logger.info("ROFL service updated: %s", output)
+        output = await self._run_oasis_command(["rofl", "update"], cwd=directory)
+        logger.info("ROFL service updated (%d bytes of output)", len(output))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ROFL update output: %s", output)
 
-    def deploy_rofl_service(self) -> None:
+    async def deploy_rofl_service(self, directory: Optional[str] = None) -> None:
         """
         Deploy ROFL service to a node.
+        
+        Args:
+            directory: The service directory to run in (defaults to cwd)
         """
-        output = self._run_oasis_command(["rofl", "deploy"])
-        logger.info("ROFL service deployed: %s", output)
+        output = await self._run_oasis_command(["rofl", "deploy"], cwd=directory)
+        logger.info("ROFL service deployed (%d bytes of output)", len(output))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ROFL deploy output: %s", output)
 
-    def show_rofl_service(self) -> Dict[str, Any]:
+    async def show_rofl_service(self) -> Dict[str, Any]:
         """
         Get information about a running ROFL service.
         
         Returns:
             Service information
         """
-        output = self._run_oasis_command(["rofl", "show"])
-        logger.info("ROFL service info: %s", output)
+        output = await self._run_oasis_command_cached(("rofl", "show"))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ROFL service info: %s", output)
 
-        # Parse output into a structured format
+        # Parse output into a structured format with a single regex pass
         # This is a simplification - actual output format may vary
-        lines = output.strip().split('\n')
-        info = {}
-
-        for line in lines:
-            if ':' in line:
-                key, value = line.split(':', 1)
-                info[key.strip()] = value.strip()
-
-        return info
+        return {
+            match.group(1).strip(): match.group(2).strip()
+            for match in _SHOW_LINE_RE.finditer(output)
+        }
 
-    def deploy_service(self,
+    async def deploy_service(self,
                        service_name: str,
                        service_code: str,
                        config: Dict[str, Any] = None) -> str:
@@ -848,11 +1551,17 @@ class ROFLClient:
 
         # Write the service code to a file
         code_path = os.path.join(service_dir, "index.js")
-        with open(code_path, "w") as f:
-            f.write(service_code)
 
-        # Initialize ROFL config
-        self.init_rofl_config(service_dir)
+        def _write_service_code() -> None:
+            with open(code_path, "w") as f:
+                f.write(service_code)
+
+        # The code write and the ROFL config init are independent, so let
+        # the file I/O overlap the oasis subprocess
+        await asyncio.gather(
+            asyncio.to_thread(_write_service_code),
+            self.init_rofl_config(service_dir)
+        )
 
         # Update config if provided
         if config:
@@ -860,27 +1569,33 @@ class ROFLClient:
             with open(config_path, "r") as f:
                 rofl_config = f.read()
 
-            # Update the config
+            # Update the config in a single regex pass over the file
+            # instead of one full-string replace per key
             # This is a simplification - actual config format may vary
+            key_pattern = re.compile(
+                r'^(' + '|'.join(map(re.escape, config)) + r'):.*$',
+                re.MULTILINE
+            )
+            rofl_config = key_pattern.sub(
+                lambda m: f"{m.group(1)}: {config[m.group(1)]}", rofl_config)
+
             with open(config_path, "w") as f:
-                for key, value in config.items():
-                    rofl_config = rofl_config.replace(f"{key}:", f"{key}: {value}")
                 f.write(rofl_config)
 
         # Create ROFL service
-        service_id = self.create_rofl_service()
+        service_id = await self.create_rofl_service(service_dir)
 
         # Build the bundle
-        self.build_rofl_bundle()
+        await self.build_rofl_bundle(service_dir)
 
         # Update and deploy
-        self.update_rofl_service()
-        self.deploy_rofl_service()
+        await self.update_rofl_service(service_dir)
+        await self.deploy_rofl_service(service_dir)
 
         logger.info("ROFL service deployed with ID: %s", service_id)
         return service_id
 
-    def call_service(self,
+    async def call_service(self,
                      service_id: str,
                      method_name: str,
                      args: Dict[str, Any] = None) -> Any:
@@ -901,32 +1616,23 @@ class ROFLClient:
         if args is None:
             args = {}
 
-        # Create a JSON file with the arguments
-        args_file = f"rofl-args-{int(time.time())}.json"
-        with open(args_file, "w") as f:
-            json.dump({
-                "method": method_name,
-                "args": args
-            }, f)
+        # Stream the arguments over stdin instead of a temp file on disk
+        payload = _json_dumps({
+            "method": method_name,
+            "args": args
+        })
 
-        try:
-            # Call the service
-            output = self._run_oasis_command([
-                "rofl", "call", service_id, "--input-file", args_file
-            ])
+        output = await self._run_oasis_command(
+            ["rofl", "call", service_id, "--input-file", "-"],
+            input_data=payload
+        )
 
-            # Parse the result
-            try:
-                result = json.loads(output)
-            except json.JSONDecodeError:
-                # If output is not valid JSON, return as is
-                result = output
-
-            return result
-        finally:
-            # Clean up the arguments file
-            if os.path.exists(args_file):
-                os.remove(args_file)
+        # Parse the result
+        try:
+            return _json_loads(output)
+        except json.JSONDecodeError:
+            # If output is not valid JSON, return as is
+            return output
 
 
 def create_sapphire_client(network: Optional[str] = None, private_key: Optional[str] = None) -> SapphireClient:
@@ -4,10 +4,16 @@ This simulates the data that would be retrieved from a real fitness tracking API
 """
 
 import datetime
-import random
 import json
 from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class TerraApiClient:
     """
@@ -26,6 +32,9 @@ class TerraApiClient:
         """
         self.user_id = user_id
         self._mock_data_cache = {}
+        # Struct-of-arrays cache: (timestamps, heart_rates) NumPy pairs,
+        # far cheaper to keep around than per-sample dicts
+        self._hr_arrays = {}
     
     def get_heart_rate_data(self, 
                            start_date: datetime.datetime, 
@@ -40,22 +49,54 @@ class TerraApiClient:
         Returns:
             A list of heart rate data points
         """
-        # Check if we have cached data for this time period
-        cache_key = f"{start_date.isoformat()}_{end_date.isoformat()}"
+        # Check if we have cached data for this time period; an int tuple
+        # hashes cheaper than a formatted string key
+        cache_key = (int(start_date.timestamp()), int(end_date.timestamp()))
         if cache_key in self._mock_data_cache:
             return self._mock_data_cache[cache_key]
-        
-        # Generate mock data
-        data = self._generate_mock_heart_rate_data(start_date, end_date)
-        
+
+        # Materialize dicts from the struct-of-arrays storage only at the
+        # public API boundary
+        timestamps, heart_rates = self.get_heart_rate_data_raw(start_date, end_date)
+        data = [
+            {
+                "timestamp": ts,
+                "heart_rate": hr,
+                "source": "mock_terra_api"
+            }
+            for ts, hr in zip(np.datetime_as_string(timestamps).tolist(), heart_rates.tolist())
+        ] if len(heart_rates) else []
+
         # Cache the data
         self._mock_data_cache[cache_key] = data
         
         return data
-    
-    def _generate_mock_heart_rate_data(self, 
-                                      start_date: datetime.datetime, 
-                                      end_date: datetime.datetime) -> List[Dict]:
+
+    def get_heart_rate_data_raw(self,
+                                start_date: datetime.datetime,
+                                end_date: datetime.datetime) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Get heart rate data as parallel NumPy arrays (struct-of-arrays).
+
+        Internal consumers that aggregate over the samples should prefer
+        this over get_heart_rate_data: two flat arrays avoid building a
+        three-key dict per sample.
+
+        Args:
+            start_date: The start date/time for the data
+            end_date: The end date/time for the data
+
+        Returns:
+            A (timestamps, heart_rates) pair of equal-length arrays
+        """
+        cache_key = (int(start_date.timestamp()), int(end_date.timestamp()))
+        if cache_key not in self._hr_arrays:
+            self._hr_arrays[cache_key] = self._generate_mock_heart_rate_arrays(start_date, end_date)
+        return self._hr_arrays[cache_key]
+
+    def _generate_mock_heart_rate_arrays(self, 
+                                         start_date: datetime.datetime, 
+                                         end_date: datetime.datetime) -> Tuple["np.ndarray", "np.ndarray"]:
         """
         Generate mock heart rate data for a specific time period.
         
@@ -64,37 +105,37 @@ class TerraApiClient:
             end_date: The end date/time for the data
             
         Returns:
-            A list of heart rate data points
+            A (timestamps, heart_rates) pair of equal-length arrays
         """
-        data = []
-        
-        # Generate data points at 1-minute intervals
-        current_time = start_date
-        while current_time <= end_date:
-            # Generate a realistic heart rate based on time of day
-            hour = current_time.hour
-            
-            # Base heart rate (resting: 60-80)
-            base_hr = random.randint(60, 80)
-            
-            # Adjust for time of day
-            if 6 <= hour < 9:  # Morning exercise
-                hr = random.randint(100, 160)
-            elif 17 <= hour < 20:  # Evening exercise
-                hr = random.randint(100, 150)
-            else:  # Normal daily activities
-                hr = base_hr + random.randint(-5, 20)
-            
-            data.append({
-                "timestamp": current_time.isoformat(),
-                "heart_rate": hr,
-                "source": "mock_terra_api"
-            })
-            
-            # Move to next minute
-            current_time += datetime.timedelta(minutes=1)
-        
-        return data
+        # One sample per minute, inclusive of both endpoints
+        num_samples = int((end_date - start_date).total_seconds() // 60) + 1
+        if num_samples <= 0:
+            empty = np.array([], dtype="datetime64[s]")
+            return empty, np.array([], dtype=np.int16)
+
+        # Vectorized generation: draw all the random samples at once and
+        # select per-sample based on the hour of day, instead of looping
+        # minute-by-minute in Python.
+        offsets = np.arange(num_samples, dtype=np.int64)
+        hours = ((start_date.hour * 60 + start_date.minute + offsets) // 60) % 24
+
+        rng = np.random.default_rng()
+        # Base heart rate (resting: 60-80)
+        base_hr = rng.integers(60, 81, size=num_samples)
+        # Morning exercise (06:00-09:00), evening exercise (17:00-20:00),
+        # otherwise normal daily activities
+        morning_hr = rng.integers(100, 161, size=num_samples)
+        evening_hr = rng.integers(100, 151, size=num_samples)
+        daily_adjustment = rng.integers(-5, 21, size=num_samples)
+
+        heart_rates = np.where(
+            (hours >= 6) & (hours < 9), morning_hr,
+            np.where((hours >= 17) & (hours < 20), evening_hr, base_hr + daily_adjustment)
+        ).astype(np.int16)
+
+        timestamps = (np.datetime64(start_date).astype("datetime64[s]")
+                      + offsets * np.timedelta64(60, "s"))
+        return timestamps, heart_rates
     
     def get_exercise_sessions(self, 
                              start_date: datetime.datetime, 
@@ -109,45 +150,53 @@ class TerraApiClient:
         Returns:
             A list of exercise sessions
         """
-        # Generate mock exercise sessions
-        sessions = []
-        
         # Determine how many days are in the range
         days = (end_date - start_date).days + 1
-        
+
+        rng = np.random.default_rng()
+
         # Generate 3-5 exercise sessions per week
-        num_sessions = int(days / 7 * random.randint(3, 5))
-        
-        for _ in range(num_sessions):
-            # Random day and time within the range
-            random_days = random.randint(0, days - 1)
-            random_hour = random.choice([7, 8, 17, 18, 19])  # Common exercise times
-            
-            session_date = start_date + datetime.timedelta(days=random_days)
+        num_sessions = int(days / 7 * rng.integers(3, 6))
+        if num_sessions <= 0:
+            return []
+
+        # Draw every random field in one vectorized batch per field
+        # instead of six stdlib random calls per session
+        day_offsets = rng.integers(0, days, size=num_sessions)
+        start_hours = rng.choice([7, 8, 17, 18, 19], size=num_sessions)  # Common exercise times
+        start_minutes = rng.integers(0, 31, size=num_sessions)
+        durations = rng.integers(30, 91, size=num_sessions)
+        activities = rng.choice(["running", "cycling", "walking", "strength_training"], size=num_sessions)
+        calories = rng.integers(200, 601, size=num_sessions)
+        avg_heart_rates = rng.integers(120, 161, size=num_sessions)
+
+        sessions = []
+        for day_offset, hour, minute, duration, activity, calorie, avg_hr in zip(
+                day_offsets.tolist(), start_hours.tolist(), start_minutes.tolist(),
+                durations.tolist(), activities.tolist(), calories.tolist(),
+                avg_heart_rates.tolist()):
+            session_date = start_date + datetime.timedelta(days=day_offset)
             session_start = datetime.datetime(
-                session_date.year, 
-                session_date.month, 
-                session_date.day, 
-                random_hour, 
-                random.randint(0, 30)
+                session_date.year,
+                session_date.month,
+                session_date.day,
+                hour,
+                minute
             )
-            
-            # Session duration between 30 and 90 minutes
-            duration_minutes = random.randint(30, 90)
-            session_end = session_start + datetime.timedelta(minutes=duration_minutes)
-            
+            session_end = session_start + datetime.timedelta(minutes=duration)
+
             # Only include if within the requested range
             if session_start >= start_date and session_end <= end_date:
                 sessions.append({
                     "start_time": session_start.isoformat(),
                     "end_time": session_end.isoformat(),
-                    "duration_minutes": duration_minutes,
-                    "activity_type": random.choice(["running", "cycling", "walking", "strength_training"]),
-                    "calories_burned": random.randint(200, 600),
-                    "average_heart_rate": random.randint(120, 160),
+                    "duration_minutes": duration,
+                    "activity_type": activity,
+                    "calories_burned": calorie,
+                    "average_heart_rate": avg_hr,
                     "source": "mock_terra_api"
                 })
-        
+
         return sessions
     
     def check_continuous_elevated_heart_rate(self, 
@@ -167,83 +216,57 @@ class TerraApiClient:
         Returns:
             A list of periods with continuously elevated heart rate
         """
-        # Get heart rate data
-        hr_data = self.get_heart_rate_data(start_date, end_date)
-        
-        # Find periods of elevated heart rate
-        elevated_periods = []
-        current_period_start = None
-        
-        for i, data_point in enumerate(hr_data):
-            hr = data_point["heart_rate"]
-            timestamp = datetime.datetime.fromisoformat(data_point["timestamp"])
-            
-            if hr >= threshold:
-                # Start a new period if not already in one
-                if current_period_start is None:
-                    current_period_start = timestamp
-            else:
-                # End the current period if there was one
-                if current_period_start is not None:
-                    period_duration = (timestamp - current_period_start).total_seconds() / 60
-                    
-                    if period_duration >= min_duration_minutes:
-                        elevated_periods.append({
-                            "start_time": current_period_start.isoformat(),
-                            "end_time": timestamp.isoformat(),
-                            "duration_minutes": period_duration,
-                            "average_heart_rate": self._calculate_average_hr(
-                                hr_data, 
-                                current_period_start, 
-                                timestamp
-                            )
-                        })
-                    
-                    current_period_start = None
-        
-        # Check if we're still in an elevated period at the end of the data
-        if current_period_start is not None:
-            last_timestamp = datetime.datetime.fromisoformat(hr_data[-1]["timestamp"])
-            period_duration = (last_timestamp - current_period_start).total_seconds() / 60
-            
-            if period_duration >= min_duration_minutes:
-                elevated_periods.append({
-                    "start_time": current_period_start.isoformat(),
-                    "end_time": last_timestamp.isoformat(),
-                    "duration_minutes": period_duration,
-                    "average_heart_rate": self._calculate_average_hr(
-                        hr_data, 
-                        current_period_start, 
-                        last_timestamp
-                    )
-                })
-        
-        return elevated_periods
-    
-    def _calculate_average_hr(self, 
-                             hr_data: List[Dict], 
-                             start_time: datetime.datetime, 
-                             end_time: datetime.datetime) -> float:
+        # Get heart rate data in the struct-of-arrays layout; no dict per
+        # sample is ever built on this path
+        timestamps, hrs = self.get_heart_rate_data_raw(start_date, end_date)
+        if not len(hrs):
+            return []
+
+        # Build a prefix sum so each period's average is O(1) instead of
+        # re-scanning the full data set per period. Samples are one minute
+        # apart, so period durations are plain index differences.
+        cum_hr = np.concatenate(([0], np.cumsum(hrs, dtype=np.int64)))
+
+        # Vectorized run detection: pad the boolean mask and diff it so
+        # rising edges mark period starts and falling edges mark the first
+        # sample below threshold (matching the old stateful loop; a run
+        # still open at the end of the data closes on the last sample).
+        above = hrs >= threshold
+        padded = np.concatenate(([False], above, [False]))
+        edges = np.diff(padded.astype(np.int8))
+        starts = np.where(edges == 1)[0]
+        ends = np.where(edges == -1)[0]
+
+        last_idx = len(hrs) - 1
+        return [
+            self._build_elevated_period(timestamps, cum_hr, start_idx, end_idx)
+            for start_idx, end_idx in zip(starts.tolist(), np.minimum(ends, last_idx).tolist())
+            if end_idx - start_idx >= min_duration_minutes
+        ]
+
+    @staticmethod
+    def _build_elevated_period(timestamps: "np.ndarray",
+                               cum_hr: "np.ndarray",
+                               start_idx: int,
+                               end_idx: int) -> Dict:
         """
-        Calculate the average heart rate for a specific time period.
-        
+        Build an elevated-period record for samples start_idx..end_idx inclusive.
+
         Args:
-            hr_data: The heart rate data
-            start_time: The start time
-            end_time: The end time
-            
+            timestamps: The sample timestamps
+            cum_hr: Prefix sum of the heart rates (len(timestamps) + 1 entries)
+            start_idx: Index of the first sample of the period
+            end_idx: Index of the last sample of the period
+
         Returns:
-            The average heart rate
+            The period record with its average heart rate
         """
-        relevant_data = [
-            d["heart_rate"] for d in hr_data 
-            if start_time <= datetime.datetime.fromisoformat(d["timestamp"]) <= end_time
-        ]
-        
-        if not relevant_data:
-            return 0
-        
-        return sum(relevant_data) / len(relevant_data)
+        return {
+            "start_time": np.datetime_as_string(timestamps[start_idx]),
+            "end_time": np.datetime_as_string(timestamps[end_idx]),
+            "duration_minutes": float(end_idx - start_idx),
+            "average_heart_rate": float(cum_hr[end_idx + 1] - cum_hr[start_idx]) / (end_idx + 1 - start_idx)
+        }
 
 
 # Helper functions for testing
@@ -282,8 +305,14 @@ def save_test_data(data: Dict, filename: str) -> None:
         data: The data to save
         filename: The filename to save to
     """
-    with open(filename, 'w') as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        # orjson serializes large nested structures (and NumPy arrays)
+        # several times faster than stdlib json
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(filename, 'w') as f:
+            json.dump(data, f, indent=2)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,157 @@
+"""
+Shared fixtures for the archived gas/deployment tests.
+
+Deploying PromiseDeposit and PromiseKeeper once per session instead of
+once per test removes redundant solc compiles and on-chain deployments;
+tests create their own promises against the shared contracts.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from dotenv import load_dotenv
+from filelock import FileLock
+
+# Add the project root to the path so imports work correctly
+project_root = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(project_root))
+
+from src.tee.sapphire import SapphireClient
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Get gas limit from environment or use an extremely high default for testing
+DEFAULT_GAS_LIMIT = int(os.getenv("DEFAULT_GAS_LIMIT", "20000000"))
+
+
+# The session-wide event loop comes from pytest-asyncio's
+# asyncio_default_*_loop_scope = session settings in pytest.ini; the old
+# event_loop fixture override is deprecated since 0.23 and gone in 1.0.
+
+
+async def deploy_shared_contracts(sapphire_client: SapphireClient):
+    """
+    Deploy PromiseDeposit and PromiseKeeper once and wire them together.
+
+    Returns:
+        A (deposit_address, keeper_address) pair
+    """
+    deposit_abi, deposit_bytecode = await SapphireClient.compile_contract("PromiseDeposit")
+    keeper_abi, keeper_bytecode = await SapphireClient.compile_contract("PromiseKeeper")
+
+    # The two deployments are independent; pre-assign consecutive nonces
+    # and run them concurrently so both can land in the same block
+    base_nonce = await sapphire_client.w3.eth.get_transaction_count(
+        sapphire_client.account.address, "pending")
+    deposit_address, keeper_address = await asyncio.gather(
+        sapphire_client.deploy_contract(
+            contract_name="PromiseDeposit",
+            contract_abi=deposit_abi,
+            contract_bytecode=deposit_bytecode,
+            constructor_args=[],
+            nonce=base_nonce
+        ),
+        sapphire_client.deploy_contract(
+            contract_name="PromiseKeeper",
+            contract_abi=keeper_abi,
+            contract_bytecode=keeper_bytecode,
+            constructor_args=[],
+            nonce=base_nonce + 1
+        )
+    )
+
+    logger.info("Setting deposit contract...")
+    # Idempotent: reads the getter first and only sends the setter when the
+    # keeper is not wired yet (gas is sized from an estimate either way)
+    await sapphire_client.ensure_deposit_contract(keeper_address, deposit_address, abi=keeper_abi)
+
+    return deposit_address, keeper_address
+
+
+async def _client_for_addresses(deposit_address: str, keeper_address: str) -> SapphireClient:
+    """Build a client wired to already-deployed contract addresses."""
+    sapphire_client = SapphireClient(default_gas_limit=DEFAULT_GAS_LIMIT)
+    deposit_abi, _ = await SapphireClient.compile_contract("PromiseDeposit")
+    keeper_abi, _ = await SapphireClient.compile_contract("PromiseKeeper")
+    sapphire_client.set_contract("PromiseDeposit", deposit_address, deposit_abi)
+    sapphire_client.set_contract("PromiseKeeper", keeper_address, keeper_abi)
+    return sapphire_client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def deployed(tmp_path_factory, worker_id):
+    """One SapphireClient with both contracts deployed and wired together.
+
+    Under pytest-xdist, only the first worker to grab the file lock runs
+    the deployment; the others read the recorded addresses and attach to
+    the same contracts, so -n N does not mean N deployments.
+    """
+    if worker_id == "master":
+        # Not running under xdist; deploy directly
+        sapphire_client = SapphireClient(default_gas_limit=DEFAULT_GAS_LIMIT)
+        deposit_address, keeper_address = await deploy_shared_contracts(sapphire_client)
+        yield sapphire_client, deposit_address, keeper_address
+        await sapphire_client.close()
+        return
+
+    root_tmp = tmp_path_factory.getbasetemp().parent
+    record_path = root_tmp / "deployed_contracts.json"
+    sapphire_client = None
+    # Hold the lock only for the deploy-and-record critical section; the
+    # winning worker must release it before running its tests or every
+    # other worker would block in fixture setup for the whole session
+    with FileLock(str(record_path) + ".lock"):
+        if not record_path.is_file():
+            sapphire_client = SapphireClient(default_gas_limit=DEFAULT_GAS_LIMIT)
+            deposit_address, keeper_address = await deploy_shared_contracts(sapphire_client)
+            record_path.write_text(json.dumps(
+                {"deposit": deposit_address, "keeper": keeper_address}))
+
+    if sapphire_client is None:
+        record = json.loads(record_path.read_text())
+        deposit_address, keeper_address = record["deposit"], record["keeper"]
+        sapphire_client = await _client_for_addresses(deposit_address, keeper_address)
+
+    yield sapphire_client, deposit_address, keeper_address
+    await sapphire_client.close()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def evm_state_snapshot(request):
+    """
+    Revert chain state between tests on nodes that support snapshots.
+
+    Enabled with TEST_EVM_SNAPSHOTS=1 against a local devnet
+    (Anvil/sapphire-localnet); each test then starts from the freshly
+    deployed world state without redeploying. Public Sapphire networks do
+    not expose evm_snapshot, so the default is off.
+    """
+    if os.getenv("TEST_EVM_SNAPSHOTS") != "1":
+        yield
+        return
+
+    # Resolve the session deployment lazily: as an autouse fixture this
+    # runs for every test in the directory, and a declared parameter
+    # would force the full contract deployment even for tests (and
+    # configurations) that never touch it
+    sapphire_client = request.getfixturevalue("deployed")[0]
+    response = await sapphire_client.w3.provider.make_request("evm_snapshot", [])
+    yield
+    # A revert consumes the snapshot; the next test's setup takes a new one
+    await sapphire_client.w3.provider.make_request("evm_revert", [response["result"]])
+
+
+@pytest.fixture(scope="session")
+def worker_id(request):
+    """The xdist worker id, or "master" when xdist is not installed/active."""
+    if hasattr(request.config, "workerinput"):
+        return request.config.workerinput["workerid"]
+    return "master"
@@ -13,12 +13,12 @@ from dotenv import load_dotenv
 root_logger = logging.getLogger()
 # Set its level to INFO
 root_logger.setLevel(logging.INFO)
-# Create a handler (e.g., StreamHandler to output to console)
-handler = logging.StreamHandler(sys.stdout)
-# Set the formatter for the handler
-handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-# Add the handler to the root logger
-root_logger.addHandler(handler)
+# Attach a console handler only once; re-imports otherwise stack
+# handlers and every record gets formatted and emitted twice
+if not root_logger.handlers:
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    root_logger.addHandler(handler)
 
 logger = logging.getLogger(__name__)
 
@@ -92,10 +92,8 @@ async def main():
 
         # Wait for receipt (optional for this step if just checking if tx is sent, but good for confirmation)
         logger.info("Waiting for receipt of setDepositContract transaction: %s...", tx_hash_set_deposit)
-        # We need the ABI for PromiseKeeper to process its events
-        if "PromiseKeeper" not in sapphire_client.contracts:
-            pk_abi, _ = await sapphire_client.compile_contract("PromiseKeeper")
-            sapphire_client.contracts["PromiseKeeper"] = {"address": promise_keeper_address, "abi": pk_abi}
+        # deploy_contract cached the PromiseKeeper ABI, so event decoding
+        # needs no recompile here
 
         event_args_deposit_updated = await sapphire_client.get_event_from_receipt(
             tx_hash=tx_hash_set_deposit,
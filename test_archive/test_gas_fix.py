@@ -9,9 +9,10 @@ from dotenv import load_dotenv
 # Basic logging setup
 root_logger = logging.getLogger()
 root_logger.setLevel(logging.INFO)
-handler = logging.StreamHandler(sys.stdout)
-handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-root_logger.addHandler(handler)
+if not root_logger.handlers:
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    root_logger.addHandler(handler)
 
 logger = logging.getLogger(__name__)
 
@@ -32,18 +33,20 @@ async def main():
         default_gas_limit=8000000  # Increased from default 6,000,000
     )
     
-    # 1. Deploy SimpleStorage contract
+    # 1. Deploy SimpleStorage contract; the ABI fetch is independent of
+    # the deployment transaction, so run both concurrently (the compile
+    # cache means solc runs only once between them)
     logger.info("Step 1: Deploying SimpleStorage contract...")
     initial_value = 123
-    contract_address = await client.deploy_contract(
-        contract_name="SimpleStorage", 
-        constructor_args=[initial_value]
+    contract_address, (contract_abi, _) = await asyncio.gather(
+        client.deploy_contract(
+            contract_name="SimpleStorage",
+            constructor_args=[initial_value]
+        ),
+        client.compile_contract("SimpleStorage")
     )
     logger.info("SimpleStorage deployed at: %s", contract_address)
     
-    # Get the contract ABI
-    contract_abi, _ = await client.compile_contract("SimpleStorage")
-    
     # 2. Call get() to verify initial value
     logger.info("Step 2: Calling get() to verify initial value...")
     result = await client.call_contract(
@@ -10,6 +10,19 @@ import json
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_artifact(path: Path) -> dict:
+    """Parse a compiled contract artifact, using orjson when available."""
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 # Get the root logger
 root_logger = logging.getLogger()
 # Set its level to INFO
@@ -23,8 +36,6 @@ root_logger.addHandler(handler)
 
 logger = logging.getLogger(__name__)
 
-load_dotenv()
-
 async def main():
     """
     Main function to test MinimalPromiseKeeper methods incrementally.
@@ -58,13 +69,10 @@ async def main():
             from compile_minimal_contracts import main as compile_contracts
             compile_contracts()
             
-        # Load MinimalPromiseDeposit.json
-        with open(build_dir / "MinimalPromiseDeposit.json", 'r') as f:
-            deposit_contract_data = json.load(f)
-            
-        # Load MinimalPromiseKeeper.json
-        with open(build_dir / "MinimalPromiseKeeper.json", 'r') as f:
-            keeper_contract_data = json.load(f)
+        # Parse both artifacts from bytes in one go; orjson cuts the JSON
+        # decode cost several-fold on the large ABI/bytecode blobs
+        deposit_contract_data = _load_artifact(build_dir / "MinimalPromiseDeposit.json")
+        keeper_contract_data = _load_artifact(build_dir / "MinimalPromiseKeeper.json")
         
         # Store the loaded ABIs in the client so they can be used without additional compilation
         sapphire_client.contracts["MinimalPromiseDeposit"] = {
@@ -107,27 +115,48 @@ async def main():
         # Update contract address in the client for later use
         sapphire_client.contracts["MinimalPromiseKeeper"]["address"] = promise_keeper_address
 
-        # Step 3: Call setDepositContract on MinimalPromiseKeeper
+        # Steps 3 and 4: setDepositContract and createPromise are
+        # independent writes, so queue both with pre-assigned consecutive
+        # nonces and await the receipts together; both can land in one
+        # block instead of paying a block time each
         logger.info(
-            "Step 3: Calling setDepositContract on MinimalPromiseKeeper (%s) with deposit address (%s)...", 
-            promise_keeper_address, deposit_address
+            "Steps 3+4: Queuing setDepositContract and createPromise on MinimalPromiseKeeper (%s)...",
+            promise_keeper_address
         )
-        
-        tx_hash_set_deposit = await sapphire_client.send_transaction(
-            contract_address=promise_keeper_address,
-            method_name="setDepositContract",
-            args=[deposit_address]
+
+        base_nonce = await sapphire_client.w3.eth.get_transaction_count(
+            sapphire_client.account.address, "pending")
+        tx_hash_set_deposit, tx_hash_create_promise = await asyncio.gather(
+            sapphire_client.send_transaction(
+                contract_address=promise_keeper_address,
+                method_name="setDepositContract",
+                args=[deposit_address],
+                nonce=base_nonce
+            ),
+            sapphire_client.send_transaction(
+                contract_address=promise_keeper_address,
+                method_name="createPromise",
+                args=[],
+                nonce=base_nonce + 1
+            )
         )
         logger.info("Transaction sent for setDepositContract: %s", tx_hash_set_deposit)
+        logger.info("Transaction sent for createPromise: %s", tx_hash_create_promise)
 
-        # Wait for receipt
-        logger.info("Waiting for receipt of setDepositContract transaction: %s...", tx_hash_set_deposit)
-
-        event_args_deposit_updated = await sapphire_client.get_event_from_receipt(
-            tx_hash=tx_hash_set_deposit,
-            contract_name_for_abi="MinimalPromiseKeeper",
-            event_name="DepositContractUpdated"
+        logger.info("Waiting for both receipts...")
+        event_args_deposit_updated, event_args_promise_created = await asyncio.gather(
+            sapphire_client.get_event_from_receipt(
+                tx_hash=tx_hash_set_deposit,
+                contract_name_for_abi="MinimalPromiseKeeper",
+                event_name="DepositContractUpdated"
+            ),
+            sapphire_client.get_event_from_receipt(
+                tx_hash=tx_hash_create_promise,
+                contract_name_for_abi="MinimalPromiseKeeper",
+                event_name="PromiseCreated"
+            )
         )
+
         if event_args_deposit_updated:
             logger.info("DepositContractUpdated event: %s", event_args_deposit_updated)
             assert event_args_deposit_updated['newAddress'] == deposit_address
@@ -136,23 +165,6 @@ async def main():
                 "DepositContractUpdated event not found. Transaction might have failed or event processing issue.")
         print("-------------------------")
 
-        # Step 4: Call createPromise on MinimalPromiseKeeper
-        logger.info("Step 4: Calling createPromise on MinimalPromiseKeeper (%s)...", promise_keeper_address)
-        
-        tx_hash_create_promise = await sapphire_client.send_transaction(
-            contract_address=promise_keeper_address,
-            method_name="createPromise",
-            args=[]
-        )
-        logger.info("Transaction sent for createPromise: %s", tx_hash_create_promise)
-
-        logger.info("Waiting for receipt of createPromise transaction: %s...", tx_hash_create_promise)
-        event_args_promise_created = await sapphire_client.get_event_from_receipt(
-            tx_hash=tx_hash_create_promise,
-            contract_name_for_abi="MinimalPromiseKeeper",
-            event_name="PromiseCreated"
-        )
-
         if event_args_promise_created:
             logger.info("PromiseCreated event: %s", event_args_promise_created)
             test_promise_id = event_args_promise_created['promiseId']  # Capture promiseId if successful
@@ -231,6 +243,10 @@ async def main():
 if __name__ == "__main__":
     import os
 
+    # Only direct runs need to load .env here; under pytest the session
+    # conftest has already parsed it once for every collected module
+    load_dotenv()
+
     if not os.getenv("OASIS_PRIVATE_KEY"):
         print("Error: OASIS_PRIVATE_KEY not found. Please set it in your .env file or environment variables.")
     else:
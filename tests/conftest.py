@@ -2,12 +2,52 @@
 Test configuration for pytest.
 This file ensures proper path setup and shared fixtures for all tests.
 """
+import hashlib
 import os
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add the parent directory to sys.path to make the self-promise package importable
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 # Import shared fixtures here if needed
+
+# Opt-in fast local iteration: skip tests whose CLI source and test file
+# are byte-identical to the last green run. Off by default so CI and
+# normal runs always execute everything.
+_SKIP_CACHED = os.getenv("SELF_PROMISE_SKIP_CACHED_TESTS") == "1"
+
+
+def _content_hash(item) -> "str | None":
+    """sha256 of the CLI module source plus the test file, or None on error."""
+    try:
+        from self_promise import self_promise_cli
+        cli_source = Path(self_promise_cli.__file__).read_bytes()
+        test_source = Path(str(item.fspath)).read_bytes()
+    except (ImportError, OSError):
+        return None
+    return hashlib.sha256(cli_source + test_source).hexdigest()
+
+
+def pytest_collection_modifyitems(config, items):
+    if not _SKIP_CACHED:
+        return
+    for item in items:
+        digest = _content_hash(item)
+        if digest and config.cache.get(f"self_promise/cli-test/{item.nodeid}", None) == digest:
+            item.add_marker(pytest.mark.skip(
+                reason="unchanged since last green run (SELF_PROMISE_SKIP_CACHED_TESTS=1)"))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    # Only pay the hash + cache write when the skip feature is enabled
+    if _SKIP_CACHED and report.when == "call" and report.passed:
+        digest = _content_hash(item)
+        if digest:
+            item.config.cache.set(f"self_promise/cli-test/{item.nodeid}", digest)
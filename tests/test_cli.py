@@ -1,5 +1,7 @@
 import json
 import os
+import re
+import time
 from pathlib import Path
 from click.testing import CliRunner
 import pytest
@@ -9,12 +11,73 @@ import click
 # and the package is installed in development mode
 from self_promise.self_promise_cli import cli, _CLI_TEST_CONFIG_DIR_OVERRIDE
 
-
-@pytest.fixture
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_json(path, data):
+    """Write a dict as JSON, via orjson's C serializer when available."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f)
+
+
+def _load_json(path):
+    """Parse a JSON file in one read, via orjson when available."""
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Mock contract addresses written to deployed_addresses.json; the content
+# never varies per test, so build the dict once at import
+# One compiled pass over the output replaces separate substring scans for
+# the success line and the auto-evidence flag, and captures the flag value
+# for a readable failure message
+_CREATE_SUCCESS_RE = re.compile(
+    r"Auto-Evidence: (True|False).*SUCCESS: Promise created successfully!", re.S)
+
+DEPLOYED_DATA = {
+    "MinimalPromiseDeposit": "0xMockMinimalDeposit",
+    "MinimalPromiseKeeper": "0xMockMinimalKeeper",
+    "RoflPromiseEvaluator": "mockRoflId123"
+}
+# The payload never varies, so serialize it once at import; the fixture
+# only writes these bytes per test
+_DEPLOYED_BYTES = (orjson.dumps(DEPLOYED_DATA) if orjson is not None
+                   else json.dumps(DEPLOYED_DATA).encode())
+
+
+@pytest.fixture(scope="session")
 def runner():
+    """One CliRunner for the whole session; invoke() isolates each call."""
     return CliRunner()
 
 
+@pytest.fixture(scope="session")
+def cli_help(runner):
+    """Render the top-level --help once per session and share the text."""
+    result = runner.invoke(cli, ['--help'])
+    assert result.exit_code == 0
+    return result.output
+
+
+@pytest.fixture(autouse=True)
+def no_simulated_latency(monkeypatch):
+    """Neutralize the CLI's cosmetic time.sleep delays during tests.
+
+    The mock OAuth/creation flows sleep for realism (up to 3s each);
+    skipping them cuts the suite from ~10s to well under a second
+    without touching any behavior the assertions check.
+    """
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+
+
 @pytest.fixture
 def mock_config_dir(tmp_path, monkeypatch):
     """Overrides the CLI's config directory to use a temporary directory."""
@@ -31,17 +94,27 @@ def mock_deployed_addresses(tmp_path, monkeypatch):
     # so that deployed_addresses.json is found by the CLI's get_service()
     monkeypatch.chdir(tmp_path)
 
-    deployed_data = {
-        "MinimalPromiseDeposit": "0xMockMinimalDeposit",
-        "MinimalPromiseKeeper": "0xMockMinimalKeeper",
-        "RoflPromiseEvaluator": "mockRoflId123"
-    }
+    # Only the chdir and the file write are per-test (cwd is per-test);
+    # the payload itself is the shared module-level constant
     deployed_file = tmp_path / "deployed_addresses.json"
-    with open(deployed_file, 'w') as f:
-        json.dump(deployed_data, f)
+    deployed_file.write_bytes(_DEPLOYED_BYTES)
     return deployed_file
 
 
+@pytest.fixture
+def connected_mockfit_tracker(mock_config_dir):
+    """Writes a mockfit trackers.json directly, skipping a CLI invocation."""
+    token_data = {
+        "access_token": f"mock_access_token_{int(time.time())}",
+        "refresh_token": f"mock_refresh_token_{int(time.time())}",
+        "expires_at": int(time.time()) + 86400,
+        "provider": "mockfit"
+    }
+    tracker_file = mock_config_dir / "trackers.json"
+    _dump_json(tracker_file, token_data)
+    return tracker_file
+
+
 @pytest.fixture
 def mock_webbrowser_open(monkeypatch):
     """Mocks webbrowser.open to prevent actual browser windows during tests."""
@@ -56,13 +129,22 @@ def mock_webbrowser_open(monkeypatch):
     return opened_urls
 
 
+def _json_after(output: str, marker: str):
+    """Parse the JSON that follows a marker line in CLI output.
+
+    find() + slice avoids splitting the whole output into substrings, and
+    a failed parse points at the offending text instead of a bare assert.
+    """
+    idx = output.find(marker)
+    assert idx >= 0, f"Marker {marker!r} not found in CLI output"
+    return json.loads(output[idx + len(marker):].lstrip())
+
+
 # --- Test Cases ---
 
-def test_cli_invokes(runner):
+def test_cli_invokes(cli_help):
     """Test that the CLI runs and shows help."""
-    result = runner.invoke(cli, ['--help'])
-    assert result.exit_code == 0
-    assert "Self-Promise: Make and keep promises" in result.output
+    assert "Self-Promise: Make and keep promises" in cli_help
 
 
 def test_connect_tracker_mockfit(runner, mock_config_dir):
@@ -72,8 +154,7 @@ def test_connect_tracker_mockfit(runner, mock_config_dir):
     assert "SUCCESS: Mockfit tracker connected successfully!" in result.output
     tracker_file = mock_config_dir / "trackers.json"
     assert tracker_file.exists()
-    with open(tracker_file, 'r') as f:
-        config = json.load(f)
+    config = _load_json(tracker_file)
     assert config["provider"] == "mockfit"
     assert "mock_access_token" in config["access_token"]
 
@@ -86,16 +167,26 @@ def test_connect_tracker_fitbit_mocked(runner, mock_config_dir, mock_webbrowser_
     assert "SUCCESS: Fitbit tracker (mock) connected successfully!" in result.output
     tracker_file = mock_config_dir / "trackers.json"
     assert tracker_file.exists()
-    with open(tracker_file, 'r') as f:
-        config = json.load(f)
+    config = _load_json(tracker_file)
     assert config["provider"] == "fitbit"
     assert "mock_fitbit_access_token" in config["access_token"]
     assert len(mock_webbrowser_open) == 1
-    assert "https://www.fitbit.com/oauth2/authorize" in mock_webbrowser_open[0]
-
-
-def test_create_promise_manual_evidence(runner, mock_deployed_addresses):
-    """Test creating a promise with manual evidence."""
+    # The authorize endpoint is the URL's prefix; startswith bails on the
+    # first differing byte instead of scanning the whole query string
+    assert mock_webbrowser_open[0].startswith("https://www.fitbit.com/oauth2/authorize")
+
+
+@pytest.mark.parametrize("auto_flag,user_input,expected_substr,expect_tracker", [
+    # Manual evidence: no prompt, no tracker
+    ('--no-auto-evidence', None, "You will need to manually submit evidence", False),
+    # Auto-evidence, no tracker, user confirms connecting one (mockfit default)
+    ('--auto-evidence', 'y\n', "Tracker connected. This promise will use auto-evidence.", True),
+    # Auto-evidence, no tracker, user declines; falls back to manual
+    ('--auto-evidence', 'n\n', "Proceeding with manual evidence submission for this promise.", False),
+], ids=["manual", "connect-yes", "connect-no"])
+def test_create_promise_evidence_modes(runner, mock_config_dir, mock_deployed_addresses, mock_webbrowser_open,
+                                       auto_flag, user_input, expected_substr, expect_tracker):
+    """Test creating a promise across the manual/auto-evidence flows."""
     params = '{"activity": "run 5k"}'
     result = runner.invoke(cli, [
         'create-promise',
@@ -104,67 +195,30 @@ def test_create_promise_manual_evidence(runner, mock_deployed_addresses):
         '--start-date', '2024-01-01',
         '--end-date', '2024-01-07',
         '--deposit-amount', '10',
-        '--no-auto-evidence'
-    ])
-    assert result.exit_code == 0
-    assert "SUCCESS: Promise created successfully!" in result.output
-    assert "You will need to manually submit evidence" in result.output
-    assert "Auto-Evidence: False" in result.output
-
-
-def test_create_promise_auto_evidence_no_tracker_connect_yes(runner, mock_config_dir, mock_deployed_addresses,
-                                                             mock_webbrowser_open):
-    """Test create promise with auto-evidence, no tracker, user says yes to connect."""
-    params = '{"activity": "read a book"}'
-    # Simulate user input 'y' for the confirmation prompt
-    result = runner.invoke(cli, [
-        'create-promise',
-        '--template-id', '2',
-        '--parameters', params,
-        '--start-date', '2024-02-01',
-        '--end-date', '2024-02-07',
-        '--deposit-amount', '20',
-        '--auto-evidence'
-    ], input='y\n')  # Provide 'y' then newline for the click.confirm
+        auto_flag
+    ], input=user_input)
 
     assert result.exit_code == 0
-    assert "SUCCESS: Promise created successfully!" in result.output
-    assert "Tracker connected. This promise will use auto-evidence." in result.output
-    assert "Auto-Evidence: True" in result.output
-    # Check if tracker config was created (connect_tracker with mockfit is called by default)
-    tracker_file = mock_config_dir / "trackers.json"
-    assert tracker_file.exists()
-    with open(tracker_file, 'r') as f:
-        config = json.load(f)
-    assert config["provider"] == "mockfit"
+    match = _CREATE_SUCCESS_RE.search(result.output)
+    assert match, "Promise creation success line not found in output"
+    assert match.group(1) == str(expect_tracker), \
+        f"Auto-Evidence was {match.group(1)}, expected {expect_tracker}"
+    assert expected_substr in result.output
 
-
-def test_create_promise_auto_evidence_no_tracker_connect_no(runner, mock_config_dir, mock_deployed_addresses):
-    """Test create promise with auto-evidence, no tracker, user says no to connect."""
-    params = '{"activity": "learn python"}'
-    result = runner.invoke(cli, [
-        'create-promise',
-        '--template-id', '3',
-        '--parameters', params,
-        '--start-date', '2024-03-01',
-        '--end-date', '2024-03-07',
-        '--deposit-amount', '30',
-        '--auto-evidence'
-    ], input='n\n')  # Provide 'n' for the click.confirm
-
-    assert result.exit_code == 0
-    assert "SUCCESS: Promise created successfully!" in result.output
-    assert "Proceeding with manual evidence submission for this promise." in result.output
-    assert "Auto-Evidence: False" in result.output  # It should switch to False
     tracker_file = mock_config_dir / "trackers.json"
-    assert not tracker_file.exists()  # Tracker should not have been connected
+    if expect_tracker:
+        # connect_tracker with mockfit is invoked by default on 'y'
+        assert tracker_file.exists()
+        config = _load_json(tracker_file)
+        assert config["provider"] == "mockfit"
+    else:
+        assert not tracker_file.exists()
 
 
-def test_create_promise_auto_evidence_with_tracker(runner, mock_config_dir, mock_deployed_addresses):
+def test_create_promise_auto_evidence_with_tracker(runner, connected_mockfit_tracker, mock_deployed_addresses):
     """Test create promise with auto-evidence when a tracker is already connected."""
-    # First, connect a tracker
-    runner.invoke(cli, ['connect-tracker', '--provider', 'mockfit'])
-    assert (mock_config_dir / "trackers.json").exists()
+    # Tracker state written directly by the fixture; no bootstrap CLI call
+    assert connected_mockfit_tracker.exists()
 
     params = '{"activity": "meditate daily"}'
     result = runner.invoke(cli, [
@@ -188,19 +242,17 @@ def test_view_promise(runner, mock_deployed_addresses):
     assert result.exit_code == 0
     assert "MockService: Fetching details for promise 'mock_promise_123'" in result.output
     # Check for JSON output (basic check)
-    try:
-        json.loads(result.output.split("MockService: Fetching details for promise 'mock_promise_123'.")[-1].strip())
-        assert True
-    except json.JSONDecodeError:
-        assert False, "Output after mock service message was not valid JSON"
+    data = _json_after(result.output, "MockService: Fetching details for promise 'mock_promise_123'.")
+    assert isinstance(data, dict)
 
 
 def test_submit_evidence(runner, tmp_path, mock_deployed_addresses):
     """Test the submit-evidence command."""
-    evidence_content = {"data": "some evidence"}
+    # The file must exist on disk - the option is a click.Path(exists=True)
+    # - but the payload is static, so write the literal bytes instead of
+    # serializing a dict
     evidence_file = tmp_path / "evidence.json"
-    with open(evidence_file, 'w') as f:
-        json.dump(evidence_content, f)
+    evidence_file.write_bytes(b'{"data": "some evidence"}')
 
     result = runner.invoke(cli, ['submit-evidence', '--promise-id', 'mock_promise_456', '--evidence-file',
                                  str(evidence_file)])
@@ -221,10 +273,9 @@ def test_trigger_auto_evaluation_no_tracker(runner, mock_config_dir, mock_deploy
     assert "No fitness tracker connected. Cannot perform automatic evaluation." in result.output
 
 
-def test_trigger_auto_evaluation_with_tracker(runner, mock_config_dir, mock_deployed_addresses):
+def test_trigger_auto_evaluation_with_tracker(runner, connected_mockfit_tracker, mock_deployed_addresses):
     """Test trigger-auto-evaluation when a tracker is connected."""
-    runner.invoke(cli, ['connect-tracker', '--provider', 'mockfit'])
-    assert (mock_config_dir / "trackers.json").exists()
+    assert connected_mockfit_tracker.exists()
 
     result = runner.invoke(cli, ['trigger-auto-evaluation', '--promise-id', 'mock_promise_789'])
     assert result.exit_code == 0
@@ -237,11 +288,8 @@ def test_status(runner, mock_deployed_addresses):
     result = runner.invoke(cli, ['status', '--promise-id', 'mock_promise_abc'])
     assert result.exit_code == 0
     assert "MockService: Getting status for promise 'mock_promise_abc'" in result.output
-    try:
-        json.loads(result.output.split("MockService: Getting status for promise 'mock_promise_abc'.")[-1].strip())
-        assert True
-    except json.JSONDecodeError:
-        assert False, "Output after mock service message was not valid JSON for status"
+    data = _json_after(result.output, "MockService: Getting status for promise 'mock_promise_abc'.")
+    assert isinstance(data, dict)
 
 
 def test_withdraw(runner, mock_deployed_addresses):